@@ -2,7 +2,12 @@
 """TGSpeechBox — global plugin.
 
 This registers the TGSpeechBox language-pack settings panel as a category
-inside NVDA's Settings dialog.
+inside NVDA's Settings dialog. Registration is deferred until the dialog is
+first opened so the panel module (and wx/YAML helpers) stay out of startup.
+
+Refreshing the Voice panel after a TGSpeechBox language change is handled by
+the synth driver itself (``SynthDriver._scheduleSettingsPanelRefresh``), so
+this plugin does not patch any NVDA GUI classes.
 
 Important:
 We do this from a global plugin (instead of from the synth driver) to match the
@@ -12,101 +17,56 @@ because global plugins are initialized when NVDA's GUI is available.
 
 from __future__ import annotations
 
+import contextlib
+
 import globalPluginHandler
 import globalVars
 
 from logHandler import log
 
+# Global plugins are loaded after NVDA's GUI is initialized, so this resolves
+# from sys.modules. Keep it guarded so a GUI-less environment can still import us.
 try:
-    import addonHandler
-
-    addonHandler.initTranslation()
-except Exception:
-    # Translation isn't critical for registration.
-    pass
+    import wx
+    from gui import settingsDialogs as _settingsDialogs
+except ImportError:
+    wx = None
+    _settingsDialogs = None
 
+# No addonHandler.initTranslation() here: this module has no user-visible
+# strings, and langPackSettingsPanel initializes translation for its own
+# globals when the (now lazy) registration first imports it.
 
+# Registered panel class, or None.
 _panelClass = None
 
+# (dialog class, original __init__ or None, installed wrapper) while pending.
+_lazyRegisterHook = None
 
-def _patchLanguageChangeRefreshInVoicePanel() -> None:
-    """Refresh YAML-backed controls when the user changes TGSpeechBox's language.
+# Settings dialog class names, newest NVDA first.
+_SETTINGS_DIALOG_NAMES = ("NVDASettingsDialog", "SettingsDialog")
 
-    NVDA updates synth settings immediately as the user changes them, but the
-    Voice settings panel only triggers a full driver-settings refresh when the
-    *voice* setting changes.
+_MISSING = object()
+_dlgClsCache: object | None = _MISSING
 
-    TGSpeechBox has several settings whose values come from the currently
-    selected language-pack YAML. When the user changes the "Language" combo box,
-    those other controls should be repopulated from the newly selected pack.
 
-    We accomplish this by monkey-patching NVDA's StringDriverSettingChanger so
-    that, for TGSpeechBox only, changing the "language" setting calls
-    updateDriverSettings(...).
+def _getSettingsDialogClass():
+    """Return the settings dialog class (varies slightly across NVDA versions).
 
-    This keeps compatibility across NVDA 2024.1 .. 2026.1 without requiring
-    changes to NVDA core.
+    The result (including "not found") is cached for the session; the dialog
+    class doesn't change once NVDA's GUI is up.
     """
+    global _dlgClsCache
+    if _dlgClsCache is not _MISSING:
+        return _dlgClsCache
 
-    try:
-        import gui
-
-        sd = getattr(gui, "settingsDialogs", None)
-        if not sd:
-            return
-        changerCls = getattr(sd, "StringDriverSettingChanger", None)
-        if changerCls is None:
-            return
-
-        # Avoid double patching.
-        if getattr(changerCls, "_tgSpeechBox_languageRefreshPatched", False):
-            return
-
-        origCall = getattr(changerCls, "__call__", None)
-        if not callable(origCall):
-            return
-
-        def _patchedCall(self, evt):
-            # First run NVDA's original handler.
-            origCall(self, evt)
-
-            # Then refresh other controls if the user just changed the language
-            # for TGSpeechBox.
-            try:
-                if getattr(getattr(self, "setting", None), "id", None) != "language":
-                    return
-                drv = getattr(self, "driver", None)
-                if drv is None:
-                    return
-                if getattr(drv, "name", None) != "tgSpeechBox":
-                    return
-                container = getattr(self, "container", None)
-                if container is None:
-                    return
-                updateFn = getattr(container, "updateDriverSettings", None)
-                if callable(updateFn):
-                    updateFn(changedSetting="language")
-            except Exception:
-                # Never let GUI-refresh failures break the settings dialog.
-                log.debug("TGSpeechBox: could not refresh voice panel after language change", exc_info=True)
-
-        changerCls.__call__ = _patchedCall  # type: ignore[assignment]
-        changerCls._tgSpeechBox_languageRefreshPatched = True
-        changerCls._tgSpeechBox_languageRefreshOrigCall = origCall
-
-        log.debug("TGSpeechBox: patched StringDriverSettingChanger for language refresh")
-    except Exception:
-        log.debug("TGSpeechBox: failed to patch voice panel language refresh", exc_info=True)
-
-
-def _getSettingsDialogClass():
-    """Return the settings dialog class (varies slightly across NVDA versions)."""
-    try:
-        import gui
-
-        return getattr(gui.settingsDialogs, "NVDASettingsDialog", None) or getattr(gui.settingsDialogs, "SettingsDialog", None)
-    except Exception:
-        return None
+    dlgCls = None
+    for name in _SETTINGS_DIALOG_NAMES:
+        dlgCls = getattr(_settingsDialogs, name, None)
+        if dlgCls is not None:
+            break
+    _dlgClsCache = dlgCls
+    return dlgCls
 
 
 def _registerPanel() -> None:
@@ -116,11 +76,17 @@ def _registerPanel() -> None:
       gui.settingsDialogs.NVDASettingsDialog.categoryClasses.append(...)
     """
     global _panelClass
+    # _panelClass doubles as the "already registered" flag, so repeat calls
+    # don't rescan the (shared, add-on-populated) categoryClasses list.
+    if _panelClass is not None:
+        return
 
     try:
         # Import here so the module isn't imported at add-on load time in secure mode.
         from synthDrivers.tgSpeechBox import langPackSettingsPanel
 
+        # _getPanelClass() memoizes the class for the session and does no YAML
+        # work; packs are only read when a panel instance is built.
         getPanelCls = getattr(langPackSettingsPanel, "_getPanelClass", None)
         panelCls = getPanelCls() if callable(getPanelCls) else None
         if panelCls is None:
@@ -151,48 +117,115 @@ def _registerPanel() -> None:
         log.error("TGSpeechBox: unable to register language-pack settings panel", exc_info=True)
 
 
+def _installLazyRegistration() -> None:
+    """Register the settings panel the first time NVDA's Settings dialog opens.
+
+    Importing the panel module pulls in wx and the YAML helpers, which is
+    wasted work at NVDA startup for users who never open Settings. Instead we
+    wrap the dialog's ``__init__`` once; the wrapper registers the panel
+    (before the dialog reads ``categoryClasses``) and then removes itself.
+    """
+    global _lazyRegisterHook
+
+    dlgCls = _getSettingsDialogClass()
+    if dlgCls is None:
+        log.error("TGSpeechBox: could not locate NVDA Settings dialog class")
+        return
+
+    # None means __init__ is inherited, so restoring is a plain delete.
+    origInit = dlgCls.__dict__.get("__init__")
+    baseInit = dlgCls.__init__
+
+    def _initWithPanel(self, *args, **kwargs):
+        _removeLazyRegistration()
+        _registerPanel()
+        baseInit(self, *args, **kwargs)
+
+    try:
+        dlgCls.__init__ = _initWithPanel
+    except Exception:
+        # Couldn't hook the dialog; fall back to registering right away.
+        log.debug("TGSpeechBox: could not defer panel registration", exc_info=True)
+        _registerPanel()
+        return
+    _lazyRegisterHook = (dlgCls, origInit, _initWithPanel)
+
+
+def _removeLazyRegistration() -> None:
+    """Undo _installLazyRegistration if the hook hasn't fired yet."""
+    global _lazyRegisterHook
+    if _lazyRegisterHook is None:
+        return
+
+    dlgCls, origInit, hook = _lazyRegisterHook
+    _lazyRegisterHook = None
+    try:
+        # Don't clobber a wrapper another add-on installed on top of ours.
+        if dlgCls.__dict__.get("__init__") is not hook:
+            return
+        if origInit is None:
+            del dlgCls.__init__
+        else:
+            dlgCls.__init__ = origInit
+    except Exception:
+        log.debug("TGSpeechBox: could not remove lazy panel registration hook", exc_info=True)
+
+
 def _unregisterPanel() -> None:
     """Best-effort unregister.
 
     NVDA doesn't normally hot-reload add-ons during a session, but removing the
     panel on terminate keeps behavior consistent with other add-ons.
     """
-
     global _panelClass
+
     if not _panelClass:
         return
 
-    try:
+    with contextlib.suppress(Exception):
         dlgCls = _getSettingsDialogClass()
-        if not dlgCls:
-            _panelClass = None
-            return
-
-        cats = getattr(dlgCls, "categoryClasses", None)
-        if isinstance(cats, list) and _panelClass in cats:
-            cats.remove(_panelClass)
-    except Exception:
-        pass
+        if dlgCls:
+            # Suppressed if categoryClasses isn't a list or no longer holds us.
+            getattr(dlgCls, "categoryClasses", None).remove(_panelClass)
 
     _panelClass = None
 
 
+def _isAppShuttingDown() -> bool:
+    """Return True if NVDA's wx main loop has already stopped (process exit)."""
+    if wx is None:
+        return False
+    try:
+        app = wx.GetApp()
+        return app is None or not app.IsMainLoopRunning()
+    except Exception:
+        return False
+
+
 class GlobalPlugin(globalPluginHandler.GlobalPlugin):
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
         # Don't load add-on UI in secure mode (Windows logon/UAC screens).
-        if getattr(globalVars.appArgs, "secure", False):
+        self._secure = bool(getattr(globalVars.appArgs, "secure", False))
+
+        # The base __init__ must still run in secure mode: it sets up the
+        # gesture map that inputCore queries on every plugin for each
+        # keystroke, so skipping it would break input rather than save time.
+        super().__init__(*args, **kwargs)
+        if self._secure:
             return
 
-        _registerPanel()
-        _patchLanguageChangeRefreshInVoicePanel()
+        _installLazyRegistration()
 
     def terminate(self):
-        try:
-            if not getattr(globalVars.appArgs, "secure", False):
-                _unregisterPanel()
-        except Exception:
-            pass
+        global _panelClass
+        if not self._secure:
+            if _isAppShuttingDown():
+                # The dialog class is about to go away with the process; only
+                # the mid-session add-on reload case needs a real unregister.
+                _panelClass = None
+            else:
+                with contextlib.suppress(Exception):
+                    _removeLazyRegistration()
+                    _unregisterPanel()
 
         super().terminate()
\ No newline at end of file
@@ -12,14 +12,21 @@ from __future__ import annotations
 import ctypes
 import math
 import os
-import queue
 import threading
-from collections import OrderedDict
+import time
+from collections import OrderedDict, deque
 from typing import Optional
 
 import config
 import nvwave
 
+# NVDA creates its wx app before loading synth drivers, so this is just a
+# sys.modules lookup; keep it guarded so the module still imports without a GUI.
+try:
+    import wx
+except ImportError:
+    wx = None
+
 from logHandler import log
 from synthDrivers import _espeak
 from synthDriverHandler import SynthDriver, VoiceInfo, synthDoneSpeaking, synthIndexReached
@@ -30,7 +37,7 @@ from autoSettingsUtils.driverSetting import (
 )
 
 # Local module imports
-from . import speechPlayer
+from . import langPackYaml, speechPlayer
 from ._dll_utils import findDllDir
 from ._frontend import NvspFrontend
 
@@ -40,11 +47,11 @@ from .constants import (
     VOICE_PROFILE_PREFIX, COALESCE_MAX_CHARS, COALESCE_MAX_INDEXES
 )
 from .text_utils import (
-    re_textPause, normalizeTextForEspeak, looksLikeSentenceEnd,
+    iterClauses, normalizeTextForEspeak, looksLikeSentenceEnd,
     splitByScript,
 )
 from .profile_utils import (
-    discoverVoiceProfiles, buildVoiceOps, applyVoiceToFrame
+    discoverVoiceProfiles, buildVoiceOps, compileFrameOps,
 )
 from .audio import BgThread, AudioThread
 from .migrate_config import run as _migrate_config
@@ -72,22 +79,76 @@ _ESPEAK_PRIMARY_TAG = {
     "es-mx": "es-419",
 }
 
+# Voice identifier chosen for each (mapped) language tag, or None when no
+# voice matches. eSpeak's voice list doesn't change while NVDA runs, so the
+# list is fetched and scanned once per tag rather than on every switch
+# (mixed-script text switches voices on every speak).
+_espeakVoiceNameCache: dict[str, Optional[str]] = {}
+
+# setVoiceByLanguage code that worked for each language, for when the
+# direct selection above fails.
+_espeakFallbackCodeCache: dict[str, str] = {}
+
+_MISSING = object()
+
+# (settings dialog class, VoiceSettingsPanel class), resolved on first use.
+_settingsDialogClassesCache = None
+
+
+def _getSettingsDialogClasses() -> tuple:
+    """Return NVDA's (settings dialog class, VoiceSettingsPanel class).
+
+    gui.settingsDialogs is imported lazily (it is heavy and only needed once
+    the user changes language); the classes don't change during a session,
+    so they are looked up once. Either entry may be None.
+    """
+    global _settingsDialogClassesCache
+    if _settingsDialogClassesCache is None:
+        from gui import settingsDialogs
+
+        # Handle different NVDA versions: NVDASettingsDialog or SettingsDialog.
+        dlgCls = getattr(settingsDialogs, "NVDASettingsDialog", None)
+        if dlgCls is None:
+            dlgCls = getattr(settingsDialogs, "SettingsDialog", None)
+        _settingsDialogClassesCache = (dlgCls, getattr(settingsDialogs, "VoiceSettingsPanel", None))
+    return _settingsDialogClassesCache
+
+
 def _espeakSetVoiceDirect(langTag: str) -> bool:
     """Set eSpeak voice using _espeak public API with accurate language matching.
 
     Returns True if the voice was set successfully.
     """
-    try:
-        voiceList = _espeak.getVoiceList()
-    except Exception:
-        return False
-    if not voiceList:
-        return False
-
     tag = langTag.lower().replace("_", "-")
     # ctypes c_char_p truncates at the first NUL, so we only see each voice's
     # primary language tag.  Map our pack tags to eSpeak's primary tags.
     tag = _ESPEAK_PRIMARY_TAG.get(tag, tag)
+
+    name = _espeakVoiceNameCache.get(tag, _MISSING)
+    if name is _MISSING:
+        try:
+            voiceList = _espeak.getVoiceList()
+        except Exception:
+            return False
+        if not voiceList:
+            # Not cached: eSpeak may just not be initialized yet.
+            return False
+        name = _espeakVoiceNameCache[tag] = _findEspeakVoiceName(voiceList, tag)
+    if name is None:
+        return False
+
+    try:
+        _espeak.setVoiceByName(name)
+        log.debug("TGSpeechBox: eSpeak voice set directly: %r -> %r", tag, name)
+        return True
+    except Exception:
+        log.debug("TGSpeechBox: setVoiceByName failed", exc_info=True)
+
+    return False
+
+
+def _findEspeakVoiceName(voiceList, tag: str) -> Optional[str]:
+    """Return the identifier of the best eSpeak voice for *tag*, or None."""
     base = tag.split("-")[0] if "-" in tag else ""
 
     exactId = None
@@ -131,33 +192,65 @@ def _espeakSetVoiceDirect(langTag: str) -> bool:
 
     chosenId = exactId or baseId
     if not chosenId:
-        return False
+        return None
 
     # Decode bytes identifier to str for the public API call.
     try:
-        name = chosenId.decode("utf-8", errors="replace") if isinstance(chosenId, bytes) else chosenId
+        return chosenId.decode("utf-8", errors="replace") if isinstance(chosenId, bytes) else chosenId
     except Exception:
-        name = chosenId
+        return chosenId
 
-    try:
-        _espeak.setVoiceByName(name)
-        log.debug("TGSpeechBox: eSpeak voice set directly: %r -> %r", tag, name)
-        return True
-    except Exception:
-        log.debug("TGSpeechBox: setVoiceByName failed", exc_info=True)
 
-    return False
+# Clause-final punctuation that sets the clause type and pause length.
+_END_PUNCT = frozenset(".?!,:;")
+
+# Micro-pause (ms) after a clause, by pause mode and clause-final token.
+# Short mode: subtle pauses for natural flow.
+# Long mode: deliberate pauses for clarity.
+_PAUSE_SHORT_MS = {".": 35.0, "!": 35.0, "?": 35.0, "...": 35.0, ":": 35.0, ";": 35.0, ",": 25.0}
+_PAUSE_LONG_MS = {".": 60.0, "!": 60.0, "?": 60.0, "...": 60.0, ":": 60.0, ";": 60.0, ",": 50.0}
+_PAUSE_TABLES = {"off": {}, "short": _PAUSE_SHORT_MS, "long": _PAUSE_LONG_MS}
+
+# Pack files the driver can't start without (others are optional at runtime).
+_REQUIRED_PACKS = (
+    "phonemes.yaml",
+    os.path.join("lang", "default.yaml"),
+)
+
 
+def _listFileNames(path: str) -> set:
+    """Return the lower-cased names of the regular files in *path*."""
+    with os.scandir(path) as it:
+        return {e.name.lower() for e in it if e.is_file()}
 
-# Pre-calculate per-voice operations for fast application
-_frameFieldNames = {x[0] for x in speechPlayer.Frame._fields_}
+
+def _findMissingPacks(packsDir: str) -> Optional[list]:
+    """Return the required pack files missing from *packsDir*.
+
+    Lists the packs folder and its lang subfolder once each instead of
+    stat-ing every required file. Names are compared case-insensitively,
+    like Windows itself. Returns None if packsDir itself doesn't exist.
+    """
+    try:
+        present = _listFileNames(packsDir)
+    except OSError:
+        return None
+    try:
+        present |= {
+            os.path.join("lang", name)
+            for name in _listFileNames(os.path.join(packsDir, "lang"))
+        }
+    except OSError:
+        pass
+    return [rel for rel in _REQUIRED_PACKS if rel.lower() not in present]
+
+
+# Pre-calculate per-voice operations; _getFrameApplier compiles the active
+# voice's ops (fused with extra params and volume) on demand.
+_frameFieldNames = frozenset(x[0] for x in speechPlayer.Frame._fields_)
 _voiceOps = buildVoiceOps(voices, _frameFieldNames)
 del _frameFieldNames
 
-# Wrapper function for backward compatibility (uses module-level _voiceOps)
-def _applyVoiceToFrame(frame: speechPlayer.Frame, voiceName: str) -> None:
-    applyVoiceToFrame(frame, voiceName, _voiceOps)
-
 
 class SynthDriver(SynthDriver):
     name = "tgSpeechBox"
@@ -257,7 +350,12 @@ class SynthDriver(SynthDriver):
         self._pauseMode = "short"
         self._language = "auto"
         self._resolvedLang = "en-us"
+        self._langTagCache = None  # (_resolvedLang, normalized tag)
+        self._ipaCache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._ipaTextBuf = None  # ctypes wchar array, grown on demand
         self._langPackSettingsCache: dict[str, object] = {}
+        # time.monotonic() before which the cache is trusted without a stat.
+        self._langPackCacheNextCheck: float = 0.0
         self._sampleRate = 16000
         
         # Initialize containers immediately to avoid NoneType errors
@@ -288,19 +386,11 @@ class SynthDriver(SynthDriver):
         packsDir = os.path.join(here, "packs")
         self._packsDir = packsDir
 
-        if not os.path.isdir(packsDir):
+        # Validate the packs directory and required pack files
+        missingRel = _findMissingPacks(packsDir)
+        if missingRel is None:
             raise RuntimeError(f"TGSpeechBox: missing packs directory at {packsDir}")
 
-        # Validate required pack files
-        requiredRel = [
-            "phonemes.yaml",
-            os.path.join("lang", "default.yaml"),
-        ]
-        missingRel = []
-        for rel in requiredRel:
-            if not os.path.isfile(os.path.join(packsDir, rel)):
-                missingRel.append(rel)
-
         if missingRel:
             raise RuntimeError(f"TGSpeechBox: missing required packs: {', '.join(missingRel)}")
 
@@ -315,6 +405,11 @@ class SynthDriver(SynthDriver):
         feDllPath = os.path.join(dllDir, 'nvspFrontend.dll')
         self._frontend = NvspFrontend(feDllPath, packsDir)
 
+        # Start the audio thread now but don't wait for it: opening the output
+        # device overlaps with pack loading and eSpeak init below, and we only
+        # wait for it right before super().__init__().
+        self._audio = AudioThread(self, self._player, self._sampleRate, waitForInit=False)
+
         if not self._frontend.setLanguage("default"):
             log.warning(f"TGSpeechBox: failed to load default pack: {self._frontend.getLastError()}")
 
@@ -342,12 +437,13 @@ class SynthDriver(SynthDriver):
             if warnings:
                 log.warning(f"TGSpeechBox: pack warnings: {warnings}")
 
-        # 7. Initialize audio system
-        self._audio = AudioThread(self, self._player, self._sampleRate)
-        self._bgQueue: "queue.Queue" = queue.Queue()
+        # 7. Initialize audio system (the audio thread was started in step 5)
+        self._bgQueue: deque = deque()
+        self._bgWake = threading.Event()
         self._bgStop = threading.Event()
         self._speakGen = 0  # Generation counter: cancel/speak race guard
-        self._bgThread = BgThread(self._bgQueue, self._bgStop, onError=self._onBgThreadError)
+        self._bgThread = BgThread(self._bgQueue, self._bgWake, self._bgStop,
+                                  onError=self._onBgThreadError)
         self._bgThread.start()
 
         # 8. Initialize eSpeak
@@ -387,6 +483,9 @@ class SynthDriver(SynthDriver):
         #    This triggers NVDA to load config and call our setters
         #    Since everything above is ready, it will succeed
         # =======================================================================
+        # Setters may restart the audio thread (sample rate), so make sure
+        # the one started in step 5 has finished opening its device first.
+        self._audio.waitForInit()
         super().__init__()
 
         # Fresh config: loadSettings() has no saved [speech.tgSpeechBox]
@@ -401,31 +500,29 @@ class SynthDriver(SynthDriver):
         self._scheduleEnableLangPackWrites()
         self._refreshLangPackSettingsCache()
 
-        # Preload optional language packs (so they're cached for fast switching).
-        # setLanguage both loads AND activates, so restore afterwards.
-        for tag in ("bg", "zh", "hu", "pt", "pl", "es"):
-            try:
-                self._frontend.setLanguage(tag)
-            except Exception:
-                pass
-        self._applyFrontendLangTag(self._resolvedLang or "en-us")
+        # Preload optional language packs into the frontend's cache so later
+        # switches are fast. This parses on a helper thread without changing
+        # the active pack, so __init__ doesn't wait for it. Older DLLs have no
+        # pack cache (preloading would just parse and discard), so skip there.
+        if self._frontend.hasPackCacheSupport():
+            self._preloadThread = threading.Thread(
+                target=self._preloadLanguagePacks,
+                args=(self._PRELOAD_LANG_TAGS,),
+                name="TGSpeechBoxPackPreload",
+                daemon=True,
+            )
+            self._preloadThread.start()
 
         # Schedule deferred re-application of voice profile
         # (in case NVDA's settings restore missed something)
         try:
-            import wx
             wx.CallAfter(self._reapplyVoiceProfile)
         except Exception:
-            # If wx isn't available yet, try a threaded approach
-            def _deferred_reapply():
-                import time
-                time.sleep(0.1)
-                try:
-                    self._reapplyVoiceProfile()
-                except Exception:
-                    pass
-            t = threading.Thread(target=_deferred_reapply, daemon=True)
-            t.start()
+            # If wx isn't available yet, run it on the (idle) background
+            # thread instead; settings are already restored at this point,
+            # and any speech queued after it will see the applied profile.
+            self._enqueue(self._reapplyVoiceProfile)
+
     @classmethod
     def check(cls):
         # Ensure DLLs exist for this NVDA / Python architecture (x86 vs x64).
@@ -438,22 +535,9 @@ class SynthDriver(SynthDriver):
             return False
 
         # Packs are expected in a local ./packs folder.
-        packsDir = os.path.join(here, 'packs')
-        if not os.path.isdir(packsDir):
-            return False
-
-        # Accept either casing on Windows, but check for both to be explicit.
-        phonemesLower = os.path.join(packsDir, 'phonemes.yaml')
-        phonemesUpper = os.path.join(packsDir, 'Phonemes.yaml')
-        if not (os.path.isfile(phonemesLower) or os.path.isfile(phonemesUpper)):
-            return False
-
-        # default.yaml is required (others are optional at runtime).
-        defaultYaml = os.path.join(packsDir, 'lang', 'default.yaml')
-        if not os.path.isfile(defaultYaml):
-            return False
-
-        return True
+        # phonemes.yaml (either casing) and lang/default.yaml are required.
+        missing = _findMissingPacks(os.path.join(here, 'packs'))
+        return missing is not None and not missing
 
     def _get_availableLanguages(self):
         return languages
@@ -627,10 +711,17 @@ class SynthDriver(SynthDriver):
             if "en" not in candidates:
                 candidates.append("en")
 
+            # Try the code that worked last time first.
+            cachedCode = _espeakFallbackCodeCache.get(resolved)
+            if cachedCode:
+                candidates.remove(cachedCode)
+                candidates.insert(0, cachedCode)
+
             for tryCode in candidates:
                 try:
                     _espeak.setVoiceByLanguage(tryCode)
                     espeakApplied = tryCode
+                    _espeakFallbackCodeCache[resolved] = tryCode
                     break
                 except Exception:
                     continue
@@ -648,13 +739,14 @@ class SynthDriver(SynthDriver):
         # Keep frontend pack selection in sync with the resolved language tag.
         try:
             if getattr(self, "_frontend", None):
-                self._applyFrontendLangTag(resolved)
+                self._applyFrontendLangTag(resolved, reload=False)
         except Exception:
             log.error("TGSpeechBox: error setting frontend language", exc_info=True)
 
         log.debug("TGSpeechBox: language setting=%r resolved=%r; eSpeak=%r; packs=%r", self._language, resolved, self._espeakLang or None, getattr(self, "_frontendLangTag", None))
         # Refresh cached language-pack settings for the (possibly) new language.
         try:
+            self.invalidateLangPackCache()
             self._refreshLangPackSettingsCache()
         except Exception:
             log.debug("TGSpeechBox: could not refresh language-pack cache", exc_info=True)
@@ -670,7 +762,6 @@ class SynthDriver(SynthDriver):
         so checkboxes reflect the new language pack's values.
         """
         try:
-            import wx
             wx.CallAfter(self._doSettingsPanelRefresh)
         except Exception:
             pass
@@ -678,18 +769,12 @@ class SynthDriver(SynthDriver):
     def _doSettingsPanelRefresh(self) -> None:
         """Actually perform the settings panel refresh (called via wx.CallAfter)."""
         try:
-            import wx
-            from gui import settingsDialogs
+            dlgCls, voicePanelCls = _getSettingsDialogClasses()
+            if dlgCls is None:
+                return
 
             # Look for an open NVDASettingsDialog.
             for win in wx.GetTopLevelWindows():
-                # Handle different NVDA versions: NVDASettingsDialog or SettingsDialog.
-                dlgCls = getattr(settingsDialogs, "NVDASettingsDialog", None)
-                if dlgCls is None:
-                    dlgCls = getattr(settingsDialogs, "SettingsDialog", None)
-                if dlgCls is None:
-                    continue
-
                 if not isinstance(win, dlgCls):
                     continue
 
@@ -711,7 +796,6 @@ class SynthDriver(SynthDriver):
                     if cat is not None:
                         panels.append(cat)
 
-                voicePanelCls = getattr(settingsDialogs, "VoiceSettingsPanel", None)
                 for panel in panels:
                     if panel is None:
                         continue
@@ -751,7 +835,6 @@ class SynthDriver(SynthDriver):
             pass
 
         try:
-            import wx
             if hasattr(wx, "CallAfter"):
                 wx.CallAfter(self._enableLangPackWrites)
                 return
@@ -764,11 +847,38 @@ class SynthDriver(SynthDriver):
 
     def _getCurrentLangTag(self) -> str:
         """Return the current resolved language tag in pack file format (lowercase, hyphen)."""
-        return str(getattr(self, "_resolvedLang", "en-us") or "en-us").strip().lower().replace("_", "-")
+        # Called from every lang-pack getter; only re-normalize when
+        # _set_language has changed _resolvedLang.
+        src = getattr(self, "_resolvedLang", "en-us")
+        cached = getattr(self, "_langTagCache", None)
+        if cached is not None and cached[0] == src:
+            return cached[1]
+        tag = str(src or "en-us").strip().lower().replace("_", "-")
+        self._langTagCache = (src, tag)
+        return tag
+
+    # Optional language packs parsed in the background at startup.
+    _PRELOAD_LANG_TAGS = ("bg", "zh", "hu", "pt", "pl", "es")
+
+    def _preloadLanguagePacks(self, tags) -> None:
+        """Parse *tags* into the frontend's pack cache (runs on a helper thread)."""
+        for tag in tags:
+            if self._bgStop.is_set():
+                return
+            frontend = getattr(self, "_frontend", None)
+            if not frontend:
+                return
+            try:
+                frontend.preloadLanguage(tag)
+            except Exception:
+                log.debug("TGSpeechBox: preloading language pack %r failed", tag, exc_info=True)
 
-    def _applyFrontendLangTag(self, tag: str) -> bool:
+    def _applyFrontendLangTag(self, tag: str, reload: bool = True) -> bool:
         """Ask the frontend to (re)load packs for *tag*, trying sensible fallbacks.
 
+        With reload=False, packs the frontend already parsed (and whose files
+        are unchanged) are reused instead of re-parsed.
+
         Returns True if the frontend reported a successful load.
         """
         if not getattr(self, "_frontend", None):
@@ -782,7 +892,8 @@ class SynthDriver(SynthDriver):
 
         for cand in candidates:
             try:
-                if self._frontend.setLanguage(cand):
+                ok = self._frontend.setLanguage(cand) if reload else self._frontend.activateLanguage(cand)
+                if ok:
                     self._frontendLangTag = cand
                     return True
             except Exception:
@@ -805,25 +916,74 @@ class SynthDriver(SynthDriver):
         ok = self._applyFrontendLangTag(tag or self._getCurrentLangTag())
         if ok:
             try:
+                self.invalidateLangPackCache()
                 self._refreshLangPackSettingsCache()
             except Exception:
                 log.debug("TGSpeechBox: could not refresh language-pack cache after reload", exc_info=True)
         return ok
 
+    # Parsed effective settings per (packsDir, langTag), shared by driver
+    # instances: (file signature, settings dict), least recently used first.
+    _LANG_PACK_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+    _LANG_PACK_CACHE_SIZE = 16
+
+    @staticmethod
+    def _langPackFilesSignature(packsDir: str, langTag: str) -> tuple:
+        """Return (mtime_ns, size) for each pack file in langTag's chain.
+
+        Missing files contribute None, so creating one also changes the
+        signature.
+        """
+        sig = []
+        for tag in langPackYaml.iterLangTagChain(langTag):
+            try:
+                st = os.stat(langPackYaml.langYamlPath(packsDir, tag))
+            except OSError:
+                sig.append(None)
+            else:
+                sig.append((st.st_mtime_ns, st.st_size))
+        return tuple(sig)
+
+    # How long a refreshed cache is trusted before the pack files are checked
+    # again. NVDA's settings dialog reads every lang-pack property in a burst.
+    _LANG_PACK_RECHECK_SECS = 0.5
+
+    def invalidateLangPackCache(self) -> None:
+        """Make the next lang-pack settings read re-check the files on disk."""
+        self._langPackCacheNextCheck = 0.0
+
     def _refreshLangPackSettingsCache(self) -> None:
         """Rebuild the cached effective YAML ``settings:`` map for the current language."""
+        now = time.monotonic()
+        if now < getattr(self, "_langPackCacheNextCheck", 0.0):
+            return
         try:
-            from . import langPackYaml
-
             packsDir = getattr(self, "_packsDir", None)
             if not packsDir:
                 self._langPackSettingsCache = {}
                 return
 
-            self._langPackSettingsCache = langPackYaml.getEffectiveSettings(
-                packsDir=packsDir,
-                langTag=self._getCurrentLangTag(),
-            )
+            langTag = self._getCurrentLangTag()
+            # Only re-parse when a pack file in the inheritance chain changed
+            # on disk; the getters below refresh on every call.
+            cacheKey = (packsDir, langTag)
+            signature = self._langPackFilesSignature(packsDir, langTag)
+            cache = SynthDriver._LANG_PACK_CACHE
+            entry = cache.get(cacheKey)
+            if entry is not None and entry[0] == signature:
+                cache.move_to_end(cacheKey)
+                settings = entry[1]
+            else:
+                settings = langPackYaml.getEffectiveSettings(
+                    packsDir=packsDir,
+                    langTag=langTag,
+                )
+                cache[cacheKey] = (signature, settings)
+                cache.move_to_end(cacheKey)
+                while len(cache) > self._LANG_PACK_CACHE_SIZE:
+                    cache.popitem(last=False)
+            self._langPackSettingsCache = settings
+            self._langPackCacheNextCheck = now + self._LANG_PACK_RECHECK_SECS
 
             # Clear previous error key on success.
             if getattr(self, "_lastLangPackCacheErrorKey", None) is not None:
@@ -846,9 +1006,7 @@ class SynthDriver(SynthDriver):
         # in NVDA's GUI don't go stale and then get written back to disk.
         self._refreshLangPackSettingsCache()
         try:
-            from . import langPackYaml
-
-            raw = getattr(self, "_langPackSettingsCache", {}).get(key)
+            raw = self._langPackSettingsCache.get(key)
             return langPackYaml.parseBool(raw, default)
         except Exception:
             return default
@@ -858,13 +1016,12 @@ class SynthDriver(SynthDriver):
         raw = getattr(self, "_langPackSettingsCache", {}).get(key)
         if raw is None:
             return default
-        return str(raw)
+        raw = str(raw)
+        return self._LANG_PACK_INTERN.get(raw, raw)
 
     def _setLangPackSetting(self, key: str, value: object) -> None:
         """Write a language-pack ``settings:`` key and reload packs."""
         try:
-            from . import langPackYaml
-
             # During driver initialization NVDA may replay persisted settings
             # from config.conf by calling our property setters. For YAML-backed
             # language-pack settings we treat YAML as authoritative, so we
@@ -905,6 +1062,10 @@ class SynthDriver(SynthDriver):
                 key=key,
                 value=value,
             )
+            # Don't trust the stat signature for our own write (a same-size
+            # edit within the filesystem's timestamp granularity looks unchanged).
+            SynthDriver._LANG_PACK_CACHE.pop((packsDir, langTag), None)
+            self.invalidateLangPackCache()
             # Reload so the frontend re-reads updated YAML.
             self.reloadLanguagePack(langTag)
         except Exception:
@@ -925,8 +1086,10 @@ class SynthDriver(SynthDriver):
             except Exception:
                 continue
             if v is not None and v != "":
-                return str(v)
-        return str(value)
+                v = str(v)
+                return self._LANG_PACK_INTERN.get(v, v)
+        value = str(value)
+        return self._LANG_PACK_INTERN.get(value, value)
 
     # ---- Language-pack quick settings exposed in the synth settings dialog ----
 
@@ -983,13 +1146,19 @@ class SynthDriver(SynthDriver):
     def _makeLangPackAccessors(attrName, yamlKey, kind="str", default=None, choices=None):
         """Generate _get/_set (and available* when needed) methods for YAML-backed settings."""
 
-        def getter(self, _key=yamlKey, _default=default, _kind=kind):
-            try:
-                if _kind == "bool":
-                    return self._getLangPackBool(_key, default=_default)
-                return self._getLangPackStr(_key, default=_default)
-            except Exception:
-                return _default
+        # Pick the typed reader once here rather than on every property read.
+        if kind == "bool":
+            def getter(self, _key=yamlKey, _default=default):
+                try:
+                    return self._getLangPackBool(_key, _default)
+                except Exception:
+                    return _default
+        else:
+            def getter(self, _key=yamlKey, _default=default):
+                try:
+                    return self._getLangPackStr(_key, _default)
+                except Exception:
+                    return _default
 
         def setter(self, val, _key=yamlKey, _kind=kind):
             try:
@@ -1076,7 +1245,15 @@ class SynthDriver(SynthDriver):
         ("stripHyphen", "stripHyphen", "bool", False, None),
     )
 
+    # One shared copy of every known YAML key and enum id. Values read back
+    # from the packs (or passed in by the settings UI) are mapped onto these,
+    # so repeated reads don't keep allocating duplicate small strings.
+    _LANG_PACK_INTERN = {_id: _id for _id in _LEGACY_PITCH_MODES}
+
     for _attrName, _yamlKey, _kind, _default, _choices in _LANG_PACK_SPECS:
+        _LANG_PACK_INTERN[_yamlKey] = _yamlKey
+        for _id in _choices or ():
+            _LANG_PACK_INTERN[_id] = _id
         for _methName, _meth in _makeLangPackAccessors(
             _attrName,
             _yamlKey,
@@ -1087,7 +1264,7 @@ class SynthDriver(SynthDriver):
             locals()[_methName] = _meth
 
     # Clean up generator helpers so they don't become part of the public driver API.
-    del _makeLangPackAccessors, _LANG_PACK_SPECS, _attrName, _yamlKey, _kind, _default, _choices, _methName, _meth
+    del _makeLangPackAccessors, _LANG_PACK_SPECS, _attrName, _yamlKey, _kind, _default, _choices, _methName, _meth, _id
 
     # Override legacyPitchMode accessor to handle migration from old boolean format.
     # Old YAML had: legacyPitchMode: false/true
@@ -1136,15 +1313,23 @@ class SynthDriver(SynthDriver):
     def _enqueue(self, func, *args, **kwargs):
         if self._bgStop.is_set():
             return
-        self._bgQueue.put((func, args, kwargs))
+        self._bgQueue.append((func, args, kwargs))
+        self._bgWake.set()
 
     def _notifyIndexesAndDone(self, indexes, generation):
         # cancel() may have invalidated this generation while it was
         # queued in BgThread — don't fire a spurious synthDoneSpeaking.
         if generation != self._speakGen:
             return
+        # Every distinct index must still be reported: NVDA's speech manager
+        # runs callbacks/advances Say All per index, so only repeats of the
+        # same index back to back are redundant.
+        notify = synthIndexReached.notify
+        last = None
         for i in indexes:
-            synthIndexReached.notify(synth=self, index=i)
+            if i != last:
+                notify(synth=self, index=i)
+                last = i
         synthDoneSpeaking.notify(synth=self)
 
     def _espeakTextToIPA(self, text: str) -> str:
@@ -1164,9 +1349,20 @@ class SynthDriver(SynthDriver):
         if not textToPhonemes:
             return ""
         
-        textBuf = ctypes.create_unicode_buffer(text)
+        # Reuse one wide-char buffer across calls (only the BgThread converts
+        # text); .value writes the text plus its terminating NUL.
+        textBuf = self._ipaTextBuf
+        # Twice the length leaves room for surrogate pairs (16-bit wchar_t)
+        # plus the NUL; an exactly full buffer would get no terminator.
+        if textBuf is None or 2 * len(text) >= len(textBuf):
+            size = 1024
+            while size <= 2 * len(text):
+                size *= 2
+            textBuf = self._ipaTextBuf = ctypes.create_unicode_buffer(size)
+        textBuf.value = text
         textPtr = ctypes.c_void_p(ctypes.addressof(textBuf))
-        chunks = []
+        # Appended in place and decoded directly: no chunk list, no join copy.
+        ipaBytes = bytearray()
         lastPtr = None
         while textPtr and textPtr.value:
             if lastPtr == textPtr.value:
@@ -1184,15 +1380,47 @@ class SynthDriver(SynthDriver):
                 self._espeakReady = False  # Disable further attempts
                 return ""
             if phonemeBuf:
-                chunks.append(ctypes.string_at(phonemeBuf))
+                ipaBytes += ctypes.string_at(phonemeBuf)
             else:
                 break
-        ipaBytes = b"".join(chunks)
         try:
             return ipaBytes.decode("utf8", errors="ignore").strip()
         except Exception:
             return ""
 
+    def _getFrameApplier(self, extraParamMultipliers: tuple):
+        """Return a compiled callable that adjusts one voiced frame.
+
+        Fuses the Python voice preset, extra parameter multipliers and the
+        volume scale into a single generated function (see compileFrameOps),
+        so _onFrame makes one call per frame instead of a chain of
+        getattr/setattr round trips. The last result is reused while the
+        voice, extra params and volume stay the same.
+        """
+        # Skip the Python voice preset when using a C++ voice profile: the
+        # formant transforms are already applied by the frontend.
+        if getattr(self, "_usingVoiceProfile", False):
+            absOps, mulOps = (), ()
+        else:
+            absOps, mulOps = _voiceOps.get(self._curVoice) or _voiceOps.get("Adam", ((), ()))
+
+        volume = float(self._curVolume)
+        mulOps = mulOps + tuple(extraParamMultipliers)
+        if volume != 1.0:
+            mulOps = mulOps + (("preFormantGain", volume),)
+
+        key = (absOps, mulOps)
+        memo = getattr(self, "_frameApplierMemo", None)
+        if memo is not None and memo[0] == key:
+            return memo[1]
+        applier = compileFrameOps(absOps, mulOps)
+        self._frameApplierMemo = (key, applier)
+        return applier
+
+    # Memoized IPA for short texts (see _espeakTextToIPA_scriptAware).
+    _IPA_CACHE_SIZE = 512
+    _IPA_CACHE_MAX_TEXT = 64
+
     def _espeakTextToIPA_scriptAware(self, text: str) -> str:
         """Convert text to IPA, switching eSpeak language for foreign-script runs.
 
@@ -1208,6 +1436,26 @@ class SynthDriver(SynthDriver):
         latinFallback = getattr(self, "_latinFallbackLang", "en-gb")
         espeakLang = getattr(self, "_espeakLang", "en")
 
+        # NVDA keeps re-announcing the same short strings (control roles,
+        # words under the caret); reuse their IPA instead of calling eSpeak.
+        # The language is part of the key, so a language change needs no flush.
+        cacheKey = None
+        if len(text) <= self._IPA_CACHE_MAX_TEXT:
+            cacheKey = (espeakLang, latinFallback, text)
+            cache = self._ipaCache
+            ipa = cache.get(cacheKey)
+            if ipa is not None:
+                cache.move_to_end(cacheKey)
+                return ipa
+
+        ipa = self._espeakTextToIPA_uncached(text, espeakLang, latinFallback)
+        if cacheKey is not None and ipa:
+            cache[cacheKey] = ipa
+            if len(cache) > self._IPA_CACHE_SIZE:
+                cache.popitem(last=False)
+        return ipa
+
+    def _espeakTextToIPA_uncached(self, text: str, espeakLang: str, latinFallback: str) -> str:
         segments = splitByScript(text, espeakLang, latinFallback)
 
         # Fast path: no script switching needed (single segment, base lang).
@@ -1258,17 +1506,24 @@ class SynthDriver(SynthDriver):
         textBuf = []
         pendingIndexes = []
         seenNonEmptyText = False
+        # Upper bound on len(" ".join(textBuf)) and the last non-blank piece,
+        # so Say All coalescing needn't re-join the buffer at every index.
+        textLen = 0
+        lastText = ""
 
         pitchOffset = 0
         bufPitchOffset = pitchOffset
 
         def flush():
-            nonlocal seenNonEmptyText, bufPitchOffset
-            raw = normalizeTextForEspeak(" ".join(textBuf))
-            textBuf.clear()
-            blocks.append((raw, pendingIndexes.copy(), bufPitchOffset))
-            pendingIndexes.clear()
+            nonlocal textBuf, pendingIndexes, seenNonEmptyText, bufPitchOffset, textLen, lastText
+            # Hand the current lists to the block and start fresh ones
+            # rather than copying and clearing them.
+            blocks.append((normalizeTextForEspeak(" ".join(textBuf)), pendingIndexes, bufPitchOffset))
+            textBuf = []
+            pendingIndexes = []
             seenNonEmptyText = False
+            textLen = 0
+            lastText = ""
             bufPitchOffset = pitchOffset
 
         for item in speechSequence:
@@ -1285,8 +1540,10 @@ class SynthDriver(SynthDriver):
                     if not textBuf and not pendingIndexes:
                         bufPitchOffset = pitchOffset
                     textBuf.append(item)
+                    textLen += len(item) + 1
                     if item.strip():
                         seenNonEmptyText = True
+                        lastText = item
                 continue
 
             if IndexCommand and isinstance(item, IndexCommand):
@@ -1303,11 +1560,17 @@ class SynthDriver(SynthDriver):
 
                 # Coalesce across wrapped lines: flush only at a "real" boundary
                 # (sentence end) or if the buffer becomes too large.
-                safeSoFar = normalizeTextForEspeak(" ".join(textBuf))
+                # Normalizing only removes whitespace, so the sentence-end test
+                # depends on the last non-blank piece alone, and the normalized
+                # length only needs computing once the raw length could reach
+                # the limit.
                 if (
-                    looksLikeSentenceEnd(safeSoFar)
-                    or len(safeSoFar) >= COALESCE_MAX_CHARS
+                    looksLikeSentenceEnd(lastText)
                     or len(pendingIndexes) >= COALESCE_MAX_INDEXES
+                    or (
+                        textLen >= COALESCE_MAX_CHARS
+                        and len(normalizeTextForEspeak(" ".join(textBuf))) >= COALESCE_MAX_CHARS
+                    )
                 ):
                     flush()
                 continue
@@ -1325,15 +1588,14 @@ class SynthDriver(SynthDriver):
         return blocks
 
     def speak(self, speechSequence):
-        indexes = []
-        anyText = False
+        # Most sequences carry text, so stop scanning at the first real text;
+        # indexes are only gathered here for the text-less case.
+        # (isspace() is what strip() uses, without building a new string.)
         for item in speechSequence:
-            if IndexCommand and isinstance(item, IndexCommand):
-                indexes.append(item.index)
-            elif isinstance(item, str) and item.strip():
-                anyText = True
-
-        if (not anyText):
+            if isinstance(item, str) and item and not item.isspace():
+                break
+        else:
+            indexes = [item.index for item in speechSequence if IndexCommand and isinstance(item, IndexCommand)]
             self._enqueue(self._notifyIndexesAndDone, indexes, self._speakGen)
             return
 
@@ -1359,19 +1621,45 @@ class SynthDriver(SynthDriver):
         lastStreamWasVoiced = False
         pauseMode = str(getattr(self, "_pauseMode", "short") or "short").strip().lower()
 
-        def _punctuationPauseMs(punctToken: str | None) -> float:
-            """Return pause duration in ms for punctuation.
-            
-            Short mode: subtle pauses for natural flow
-            Long mode: deliberate pauses for clarity
-            """
-            if not punctToken or pauseMode == "off":
-                return 0.0
-            if punctToken in (".", "!", "?", "...", ":", ";"):
-                return 60.0 if pauseMode == "long" else 35.0
-            if punctToken == ",":
-                return 50.0 if pauseMode == "long" else 25.0
-            return 0.0
+        # queueFrame/queueFrameEx copy the struct into the DLL's own queue
+        # before returning, so one scratch Frame/FrameEx per speak is enough
+        # instead of allocating a fresh pair for every voiced frame.
+        scratchFrame = speechPlayer.Frame()
+        scratchFrameEx = speechPlayer.FrameEx()
+        scratchFrameRef = ctypes.byref(scratchFrame)
+        scratchFrameExRef = ctypes.byref(scratchFrameEx)
+        frameSize = ctypes.sizeof(speechPlayer.Frame)
+        frameExSize = ctypes.sizeof(speechPlayer.FrameEx)
+        memmove = ctypes.memmove
+        # Both players this speak could see load the same DLL, so FrameEx
+        # support can't change mid-utterance.
+        playerHasFrameEx = bool(getattr(self._player, "hasFrameExSupport", lambda: False)())
+
+        # Unknown modes behave like "short".
+        pauseTable = _PAUSE_TABLES.get(pauseMode, _PAUSE_SHORT_MS)
+
+        # Pre-calculate extra parameter multipliers once per speak: none of
+        # their inputs change mid-utterance, and this keeps the
+        # getattr(self, "speechPlayer_...") lookups off the per-chunk path.
+        extraParamMultipliers = ()
+        if self.exposeExtraParams:
+            try:
+                pairs = []
+                # _extraParamAttrNames is built alongside _extraParamNames in __init__.
+                for paramName, attrName in zip(self._extraParamNames, self._extraParamAttrNames):
+                    try:
+                        ratio = float(getattr(self, attrName, 50)) / 50.0
+                    except Exception:
+                        continue
+                    # Skip default (ratio=1.0) to keep the per-frame hot path tiny.
+                    if ratio != 1.0:
+                        pairs.append((paramName, ratio))
+
+                extraParamMultipliers = tuple(pairs)
+            except Exception:
+                extraParamMultipliers = ()
+
+        applyFrameOps = self._getFrameApplier(extraParamMultipliers)
 
         for (text, indexesAfter, blockPitchOffset) in blocks:
             # Bail if cancel() invalidated this generation
@@ -1380,7 +1668,7 @@ class SynthDriver(SynthDriver):
 
             # Speak text for this block.
             if text:
-                for chunk in re_textPause.split(text):
+                for chunk in iterClauses(text):
                     # Check again between chunks for fast cancellation
                     if generation != self._speakGen:
                         return
@@ -1388,30 +1676,32 @@ class SynthDriver(SynthDriver):
                     if not chunk:
                         continue
 
-                    chunk = normalizeTextForEspeak(chunk)
-                    if not chunk:
-                        continue
+                    # Block text was normalized by _buildBlocks.flush(), and
+                    # splitting only drops the single space after punctuation,
+                    # so a clause can at most carry stray edge whitespace (an
+                    # uncollapsed Unicode space). strip() returns the same
+                    # object when there is none.
+                    if chunk is not text:
+                        chunk = chunk.strip()
+                        if not chunk:
+                            continue
 
                     # Determine punctuation at the *end* of the chunk.
                     # This influences two things:
                     # - clauseType passed to the frontend (intonation hints)
                     # - optional micro-pause insertion after the chunk
-                    punctToken = None
                     s = chunk.rstrip()
-                    if s.endswith("..."):
+                    if s[-3:] == "...":
                         punctToken = "..."
                         # Frontend only reads 1 byte; treat ellipsis as '.' for prosody.
                         clauseType = "."
-                    elif s and (s[-1] in ".?!,:;"):
-                        punctToken = s[-1]
-                        clauseType = s[-1]
-                    elif s and (s[-1] == ","):
-                        punctToken = ","
-                        clauseType = ","
                     else:
-                        clauseType = None
+                        punctToken = s[-1:]
+                        if punctToken not in _END_PUNCT:
+                            punctToken = None
+                        clauseType = punctToken
 
-                    punctPauseMs = _punctuationPauseMs(punctToken)
+                    punctPauseMs = pauseTable.get(punctToken, 0.0)
 
                     ipaText = self._espeakTextToIPA_scriptAware(chunk)
                     if not ipaText:
@@ -1434,30 +1724,6 @@ class SynthDriver(SynthDriver):
                     sawRealFrameInThisUtterance = False
                     sawSilenceAfterVoice = False
 
-                    # Pre-calculate extra parameter multipliers once per utterance.
-                    # This avoids repeated getattr(self, f"speechPlayer_{p}") lookups on every frame.
-                    extraParamMultipliers = ()
-                    if self.exposeExtraParams:
-                        try:
-                            names = getattr(self, "_extraParamNames", ()) or ()
-                            attrNames = getattr(self, "_extraParamAttrNames", None)
-                            if not attrNames or len(attrNames) != len(names):
-                                attrNames = [f"speechPlayer_{x}" for x in names]
-
-                            pairs = []
-                            for paramName, attrName in zip(names, attrNames):
-                                try:
-                                    ratio = float(getattr(self, attrName, 50)) / 50.0
-                                except Exception:
-                                    continue
-                                # Skip default (ratio=1.0) to keep the per-frame hot path tiny.
-                                if ratio != 1.0:
-                                    pairs.append((paramName, ratio))
-
-                            extraParamMultipliers = tuple(pairs)
-                        except Exception:
-                            extraParamMultipliers = ()
-
                     def _onFrame(framePtr, frameExPtr, frameDuration, fadeDuration, idxToSet):
                         nonlocal queuedCount, hadRealSpeech, sawRealFrameInThisUtterance, sawSilenceAfterVoice, lastStreamWasVoiced
 
@@ -1496,28 +1762,20 @@ class SynthDriver(SynthDriver):
                         sawRealFrameInThisUtterance = True
                         hadRealSpeech = True
 
-                        # Copy C frame to Python-owned Frame
-                        frame = speechPlayer.Frame()
-                        ctypes.memmove(ctypes.byref(frame), framePtr, ctypes.sizeof(speechPlayer.Frame))
+                        # Copy C frame into the reusable Python-owned Frame
+                        frame = scratchFrame
+                        memmove(scratchFrameRef, framePtr, frameSize)
 
-                        # Only apply Python voice preset if NOT using a C++ voice profile.
-                        # When using a profile, the formant transforms are already applied by the frontend.
-                        if not getattr(self, "_usingVoiceProfile", False):
-                            _applyVoiceToFrame(frame, self._curVoice)
-
-                        if extraParamMultipliers:
-                            for paramName, ratio in extraParamMultipliers:
-                                setattr(frame, paramName, getattr(frame, paramName) * ratio)
-
-                        frame.preFormantGain *= self._curVolume
+                        # Voice preset, extra params and volume in one call.
+                        applyFrameOps(frame)
                         
                         # Use FrameEx from frontend callback if available (ABI v2+)
                         # Frontend has already mixed per-phoneme values with user defaults
                         frameEx = None
-                        if frameExPtr and getattr(self._player, "hasFrameExSupport", lambda: False)():
-                            # Copy C FrameEx to Python-owned struct
-                            frameEx = speechPlayer.FrameEx()
-                            ctypes.memmove(ctypes.byref(frameEx), frameExPtr, ctypes.sizeof(speechPlayer.FrameEx))
+                        if frameExPtr and playerHasFrameEx:
+                            # Copy C FrameEx into the reusable Python-owned struct
+                            frameEx = scratchFrameEx
+                            memmove(scratchFrameExRef, frameExPtr, frameExSize)
                         
                         # Use queueFrameEx if we have FrameEx data, otherwise fall back
                         if frameEx is not None:
@@ -1650,12 +1908,7 @@ class SynthDriver(SynthDriver):
 
             # Drain pending jobs as an optimisation (they'd bail on generation
             # mismatch anyway, but this avoids the dequeue-and-bail overhead).
-            try:
-                while True:
-                    self._bgQueue.get_nowait()
-                    self._bgQueue.task_done()
-            except queue.Empty:
-                pass
+            self._bgQueue.clear()
 
             # === PHASE 3: Purge frame queue and flush resonators ===
             # We do NOT call player.synthesize() here because the
@@ -1687,13 +1940,11 @@ class SynthDriver(SynthDriver):
             if hasattr(self, "_bgStop"):
                 self._bgStop.set()
             if hasattr(self, "_bgQueue"):
-                # Put None to wake up the queue.get() if it's blocking
+                # Queue the None sentinel and wake the thread if it's waiting
                 try:
-                    self._bgQueue.put_nowait(None)
-                except queue.Full:
-                    # Queue is full - thread should wake up anyway when processing items
-                    pass
-                except (AttributeError, TypeError):
+                    self._bgQueue.append(None)
+                    self._bgWake.set()
+                except AttributeError:
                     # Queue not properly initialized
                     pass
             
@@ -1718,13 +1969,32 @@ class SynthDriver(SynthDriver):
                     log.debug("TGSpeechBox: bgThread join failed", exc_info=True)
                 self._bgThread = None
             
+            # The pack preloader calls into the frontend handle; let it finish
+            # its current language (it checks _bgStop between languages).
+            preloadRunning = False
+            preloadThread = getattr(self, "_preloadThread", None)
+            if preloadThread is not None:
+                try:
+                    preloadThread.join(timeout=2.0)
+                except Exception:
+                    log.debug("TGSpeechBox: preload thread join failed", exc_info=True)
+                preloadRunning = preloadThread.is_alive()
+                self._preloadThread = None
+
             # Terminate frontend (unloads nvspFrontend.dll)
             # Do this BEFORE terminating player since frontend may reference player resources
             if getattr(self, "_frontend", None):
-                try:
-                    self._frontend.terminate()
-                except Exception:
-                    log.debug("TGSpeechBox: frontend terminate failed", exc_info=True)
+                if preloadRunning:
+                    # A native preload call is still parsing with our handle.
+                    # Destroying it (or unloading the DLL) under that call would
+                    # crash NVDA, so leak both instead; the preloader keeps its
+                    # own reference and stops after the current language.
+                    log.warning("TGSpeechBox: pack preload still running at terminate; not unloading frontend")
+                else:
+                    try:
+                        self._frontend.terminate()
+                    except Exception:
+                        log.debug("TGSpeechBox: frontend terminate failed", exc_info=True)
                 self._frontend = None
             
             # Terminate player last (unloads speechPlayer.dll)
@@ -1799,10 +2069,18 @@ class SynthDriver(SynthDriver):
             log.debug("TGSpeechBox: loadSettings frontend re-sync failed", exc_info=True)
 
     def _get_rate(self):
+        # NVDA reads rate far more often than it changes; reuse the last
+        # conversion while _curRate is the same value.
+        curRate = getattr(self, "_curRate", 1.0)
+        cached = getattr(self, "_rateCache", None)
+        if cached is not None and cached[0] == curRate:
+            return cached[1]
         try:
-            return int(math.log(getattr(self, "_curRate", 1.0) / 0.25, 2) * 25.0)
+            rate = int(math.log(curRate / 0.25, 2) * 25.0)
         except Exception:
             return 50
+        self._rateCache = (curRate, rate)
+        return rate
 
     def _set_rate(self, val):
         try:
@@ -62,8 +62,19 @@ def _archFolderName() -> Optional[str]:
     return None
 
 
+# baseDir -> DLL directory found for it. The process arch never changes, and
+# NVDA calls check() and then constructs the driver, so without this the PE
+# headers are read twice at startup (and again on every driver reload).
+# Only hits are kept, so DLLs installed later are still found.
+_dllDirCache: dict[str, str] = {}
+
+
 def findDllDir(baseDir: str) -> Optional[str]:
     """Return directory containing speechPlayer.dll + nvspFrontend.dll for this process arch."""
+    cached = _dllDirCache.get(baseDir)
+    if cached is not None:
+        return cached
+
     expectedMachine = _expectedPeMachine()
     archFolder = _archFolderName()
 
@@ -86,6 +97,7 @@ def findDllDir(baseDir: str) -> Optional[str]:
                 if _readPeMachine(fe) != expectedMachine:
                     continue
 
+            _dllDirCache[baseDir] = d
             return d
         except OSError:
             # Non-fatal: try next candidate.
@@ -122,3 +134,34 @@ def freeDll(dll) -> bool:
     except Exception:
         log.debug("TGSpeechBox: freeDll failed", exc_info=True)
         return False
+
+
+def joinMmcssTask(taskName: str) -> Optional[int]:
+    """Register the calling thread with MMCSS under *taskName* (e.g. "Pro Audio").
+
+    The Multimedia Class Scheduler boosts registered threads so audio work
+    isn't starved under load. Returns a handle for leaveMmcssTask, or None
+    if registration isn't available.
+    """
+    try:
+        avrt = ctypes.windll.avrt
+        avrt.AvSetMmThreadCharacteristicsW.argtypes = [ctypes.c_wchar_p, ctypes.POINTER(ctypes.c_ulong)]
+        avrt.AvSetMmThreadCharacteristicsW.restype = ctypes.c_void_p
+        taskIndex = ctypes.c_ulong(0)
+        return avrt.AvSetMmThreadCharacteristicsW(taskName, ctypes.byref(taskIndex)) or None
+    except Exception:
+        log.debug("TGSpeechBox: AvSetMmThreadCharacteristicsW failed", exc_info=True)
+        return None
+
+
+def leaveMmcssTask(handle: Optional[int]) -> None:
+    """Undo joinMmcssTask for the calling thread."""
+    if not handle:
+        return
+    try:
+        avrt = ctypes.windll.avrt
+        avrt.AvRevertMmThreadCharacteristics.argtypes = [ctypes.c_void_p]
+        avrt.AvRevertMmThreadCharacteristics.restype = ctypes.c_int
+        avrt.AvRevertMmThreadCharacteristics(handle)
+    except Exception:
+        log.debug("TGSpeechBox: AvRevertMmThreadCharacteristics failed", exc_info=True)
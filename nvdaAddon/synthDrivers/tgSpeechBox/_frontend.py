@@ -8,6 +8,7 @@ Keeping the low-level DLL glue in a dedicated module makes the synth driver's
 from __future__ import annotations
 
 import ctypes
+import functools
 import os
 from typing import Optional
 
@@ -53,6 +54,23 @@ class FrameEx(ctypes.Structure):
     ]
 
 
+# FrameRecord struct matching nvspFrontend_FrameRecord in the DLL (ABI v5+)
+class FrameRecord(ctypes.Structure):
+    _fields_ = [
+        ("frame", speechPlayer.Frame),
+        ("frameEx", FrameEx),
+        ("durationMs", ctypes.c_double),
+        ("fadeMs", ctypes.c_double),
+        ("userIndex", ctypes.c_int),
+        ("flags", ctypes.c_int),
+    ]
+
+
+# FrameRecord.flags bits
+RECORD_HAS_FRAME = 0x1
+RECORD_HAS_FRAMEEX = 0x2
+
+
 # VoicingTone struct matching nvspFrontend_VoicingTone in the DLL (ABI v2+)
 class VoicingTone(ctypes.Structure):
     _fields_ = [
@@ -97,6 +115,15 @@ class VoiceProfileSliders(ctypes.Structure):
     ]
 
 
+@functools.lru_cache(maxsize=64)
+def _encodeLangTag(langTag: str) -> bytes:
+    """Normalize a language tag ("en_US" -> "en-us") and encode it for the DLL.
+
+    Tags come from a small fixed set, so the result is memoized.
+    """
+    return (langTag or "").strip().lower().replace("_", "-").encode("utf-8")
+
+
 class NvspFrontend(object):
     """Thin ctypes wrapper around nvspFrontend.dll.
 
@@ -304,6 +331,40 @@ class NvspFrontend(object):
                     log.debug("TGSpeechBox: text parser API available (ABI v4+)")
                 except AttributeError:
                     log.debug("TGSpeechBox: text parser API not available")
+
+            # Pack cache API (ABI v6+) — fast language switching and background preloading.
+            self._hasPackCacheApi = False
+            if self._abiVersion >= 6:
+                try:
+                    for fn in (self._dll.nvspFrontend_activateLanguage, self._dll.nvspFrontend_preloadLanguage):
+                        fn.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+                        fn.restype = ctypes.c_int
+                    self._hasPackCacheApi = True
+                except AttributeError:
+                    log.debug("TGSpeechBox: pack cache API not available")
+
+            # Batch API (ABI v5+) — returns all frames of a clause in one call
+            # instead of one ctypes callback per frame.
+            self._hasBatchApi = False
+            if self._abiVersion >= 5:
+                try:
+                    self._dll.nvspFrontend_queueIPA_Batch.argtypes = [
+                        ctypes.c_void_p,  # handle
+                        ctypes.c_char_p,  # textUtf8
+                        ctypes.c_char_p,  # ipaUtf8
+                        ctypes.c_double,  # speed
+                        ctypes.c_double,  # basePitch
+                        ctypes.c_double,  # inflection
+                        ctypes.c_char_p,  # clauseTypeUtf8
+                        ctypes.c_int,  # userIndexBase
+                        ctypes.POINTER(ctypes.POINTER(FrameRecord)),  # outRecords
+                        ctypes.POINTER(ctypes.c_int),  # outCount
+                    ]
+                    self._dll.nvspFrontend_queueIPA_Batch.restype = ctypes.c_int
+                    self._hasBatchApi = True
+                    log.debug("TGSpeechBox: frame batch API available (ABI v5+)")
+                except AttributeError:
+                    log.debug("TGSpeechBox: frame batch API not available")
         except AttributeError:
             log.debug("TGSpeechBox: frontend FrameEx API not available (older DLL)")
 
@@ -359,8 +420,36 @@ class NvspFrontend(object):
     def setLanguage(self, langTag: str) -> bool:
         if not self._dll or not self._h:
             return False
-        tag = (langTag or "").strip().lower().replace("_", "-")
-        ok = int(self._dll.nvspFrontend_setLanguage(self._h, tag.encode("utf-8")))
+        ok = int(self._dll.nvspFrontend_setLanguage(self._h, _encodeLangTag(langTag)))
+        return bool(ok)
+
+    def hasPackCacheSupport(self) -> bool:
+        """Check if the DLL can cache parsed packs (ABI v6+)."""
+        return getattr(self, "_hasPackCacheApi", False)
+
+    def activateLanguage(self, langTag: str) -> bool:
+        """Like setLanguage, but reuses already parsed packs whose files are unchanged.
+
+        Falls back to setLanguage (always re-parse) on older DLLs.
+        """
+        if not self.hasPackCacheSupport():
+            return self.setLanguage(langTag)
+        if not self._dll or not self._h:
+            return False
+        ok = int(self._dll.nvspFrontend_activateLanguage(self._h, _encodeLangTag(langTag)))
+        return bool(ok)
+
+    def preloadLanguage(self, langTag: str) -> bool:
+        """Parse packs for langTag into the DLL's cache without switching to it.
+
+        Safe to call from a background thread. Returns False on older DLLs
+        (which have nowhere to keep the result).
+        """
+        if not self.hasPackCacheSupport():
+            return False
+        if not self._dll or not self._h:
+            return False
+        ok = int(self._dll.nvspFrontend_preloadLanguage(self._h, _encodeLangTag(langTag)))
         return bool(ok)
 
     def setVoiceProfile(self, profileName: str) -> bool:
@@ -653,6 +742,11 @@ class NvspFrontend(object):
         if clauseType:
             clauseUtf8 = str(clauseType)[0].encode("ascii", errors="ignore") or b"."
 
+        if getattr(self, "_hasBatchApi", False):
+            return self._queueIPA_Batch(
+                textUtf8, ipaUtf8, speed, basePitch, inflection, clauseUtf8, userIndex, onFrame
+            )
+
         first = True
 
         @self._CBTYPE_EX
@@ -683,6 +777,70 @@ class NvspFrontend(object):
         )
         return bool(ok)
 
+    def _queueIPA_Batch(
+        self,
+        textUtf8: bytes,
+        ipaUtf8: bytes,
+        speed: float,
+        basePitch: float,
+        inflection: float,
+        clauseUtf8: Optional[bytes],
+        userIndex: Optional[int],
+        onFrame,
+    ) -> bool:
+        """queueIPA_ExWithText via the batch API (ABI v5+).
+
+        The DLL converts the whole clause up front and hands back an array of
+        FrameRecords, so there is no ctypes callback thunk per frame. onFrame
+        is then called with the same arguments as in the callback path, with
+        plain addresses (or None) in place of the frame pointers.
+        """
+        recordsPtr = ctypes.POINTER(FrameRecord)()
+        count = ctypes.c_int(0)
+        ok = int(
+            self._dll.nvspFrontend_queueIPA_Batch(
+                self._h,
+                textUtf8,
+                ipaUtf8,
+                float(speed),
+                float(basePitch),
+                float(inflection),
+                clauseUtf8,
+                int(-1),
+                ctypes.byref(recordsPtr),
+                ctypes.byref(count),
+            )
+        )
+        if not ok:
+            return False
+        n = count.value
+        if n <= 0 or not recordsPtr:
+            return True
+
+        # The records live in a DLL-owned buffer that stays valid until our
+        # next batch call; onFrame copies out whatever it keeps.
+        base = ctypes.addressof(recordsPtr.contents)
+        records = (FrameRecord * n).from_address(base)
+        recordSize = ctypes.sizeof(FrameRecord)
+        frameOffset = FrameRecord.frame.offset
+        frameExOffset = FrameRecord.frameEx.offset
+
+        first = True
+        for i, rec in enumerate(records):
+            addr = base + i * recordSize
+            flags = rec.flags
+            framePtr = addr + frameOffset if flags & RECORD_HAS_FRAME else None
+            frameExPtr = addr + frameExOffset if flags & RECORD_HAS_FRAMEEX else None
+
+            idx = None
+            if framePtr:
+                if first and userIndex is not None:
+                    idx = userIndex
+                first = False
+
+            onFrame(framePtr, frameExPtr, rec.durationMs, rec.fadeMs, idx)
+        return True
+
     def getVoicingTone(self) -> Optional[VoicingTone]:
         """Get the voicing tone parameters for the current voice profile (ABI v2+).
         
@@ -2,77 +2,108 @@
 """NV Speech Player - Audio thread management.
 
 This module contains:
-- _BgThread: Background thread for text->IPA->frames generation
-- _AudioThread: Thread that pulls synthesized audio and feeds WavePlayer
+- BgThread: Background thread for text->IPA->frames generation
+- AudioThread: Thread that pulls synthesized audio and feeds WavePlayer
 """
 
 import array
 import ctypes
+import itertools
 import math
-import queue
+import operator
 import threading
 import weakref
+from collections import deque
+from functools import partial
+from typing import Optional
 
 import config
 import nvwave
 from logHandler import log
 from synthDriverHandler import synthDoneSpeaking, synthIndexReached
 
+from ._dll_utils import joinMmcssTask, leaveMmcssTask
+
+
+# Config section holding "outputDevice" ("audio" or "speech"), once known.
+_outputDeviceSection = None
+
+
+def _notifyIndex(synth, index: int) -> None:
+    """WavePlayer onDone callback: report that an index has been spoken."""
+    if synth:
+        synthIndexReached.notify(synth=synth, index=index)
+
 
 class BgThread(threading.Thread):
     """Runs text->IPA->frames generation so speak() doesn't block NVDA."""
 
-    def __init__(self, q: "queue.Queue", stopEvent: threading.Event, onError=None):
+    def __init__(self, q: deque, wakeEvent: threading.Event,
+                 stopEvent: threading.Event, onError=None):
+        """Initialize background thread.
+
+        Args:
+            q: Job deque; producers append (func, args, kwargs), or None to stop
+            wakeEvent: Set by producers after appending to q
+            stopEvent: Set when the driver is terminating
+            onError: Optional callback run after a job raises
+        """
         super().__init__(name=f"{self.__class__.__module__}.{self.__class__.__qualname__}")
         self.daemon = True
         self._q = q
+        self._wake = wakeEvent
         self._stop = stopEvent
         self._onError = onError
 
     def run(self):
-        while not self._stop.is_set():
-            try:
-                item = self._q.get(timeout=0.2)
-            except queue.Empty:
-                continue
-            try:
+        # deque.append/popleft are atomic, so the only synchronisation needed
+        # is the wake event; no lock per job and no polling timeout.
+        q = self._q
+        wake = self._wake
+        stop = self._stop
+        while not stop.is_set():
+            wake.wait()
+            wake.clear()
+            while not stop.is_set():
+                try:
+                    item = q.popleft()
+                except IndexError:
+                    break
                 if item is None:
                     return
-                func, args, kwargs = item
-                func(*args, **kwargs)
-            except Exception:
-                log.error("nvSpeechPlayer: error in background thread", exc_info=True)
-                # Safety: ensure AudioThread doesn't hang waiting for frames
-                # that will never come (e.g. if _speakBg crashed after setting
-                # allFramesQueued=False).
-                if self._onError:
-                    try:
-                        self._onError()
-                    except Exception:
-                        pass
-            finally:
                 try:
-                    self._q.task_done()
+                    func, args, kwargs = item
+                    func(*args, **kwargs)
                 except Exception:
-                    # Should be extremely rare; log for diagnosability.
-                    log.debug("nvSpeechPlayer: background queue task_done failed", exc_info=True)
+                    log.error("nvSpeechPlayer: error in background thread", exc_info=True)
+                    # Safety: ensure AudioThread doesn't hang waiting for frames
+                    # that will never come (e.g. if _speakBg crashed after setting
+                    # allFramesQueued=False).
+                    if self._onError:
+                        try:
+                            self._onError()
+                        except Exception:
+                            pass
 
 
 class AudioThread(threading.Thread):
     """Pulls synthesized audio from the DLL and feeds nvwave.WavePlayer."""
     
-    # Pre-compute cosine fade table for fast lookup (256 entries)
+    # Resolution of the cosine fade curve (gain steps across the ramp)
     _FADE_TABLE_SIZE = 256
-    _fadeTable = tuple((1.0 - math.cos(i * math.pi / 255)) / 2.0 
-                       for i in range(256))
+
+    # Samples requested from the DLL per synthesize() call
+    _CHUNK_SAMPLES = 8192
     
-    def __init__(self, synth, player, sampleRate: int):
+    def __init__(self, synth, player, sampleRate: int, waitForInit: bool = True):
         """Initialize audio thread.
         
         Args:
             synth: Reference to the SynthDriver instance
             player: speechPlayer.SpeechPlayer instance
             sampleRate: Audio sample rate in Hz
+            waitForInit: Block until the WavePlayer is created. Pass False to
+                overlap device setup with other work, then call waitForInit().
         """
         super().__init__(name=f"{self.__class__.__module__}.{self.__class__.__qualname__}")
         self.daemon = True
@@ -100,64 +131,118 @@ class AudioThread(threading.Thread):
         self._applyFadeIn = False
         # Fade duration in samples (~12ms for smooth transition that covers stop() discontinuity)
         self._fadeInSamples = int(sampleRate * 0.012)
-        # Pre-allocated silence buffer (3ms) to prepend before faded audio
+        # Two output buffers, used alternately. WinMM keeps playing the last
+        # fed chunk from our memory after feed() returns (it only syncs on the
+        # previous chunk), so the buffer just fed must not be overwritten by
+        # the next synthesize() call.
+        self._chunkBufs = (
+            (ctypes.c_short * self._CHUNK_SAMPLES)(),
+            (ctypes.c_short * self._CHUNK_SAMPLES)(),
+        )
+
+        # Pre-allocated silence (3ms) to prepend before faded audio
         # This gives the audio device time to stabilize before non-zero samples
-        self._silencePrefix = bytes(int(sampleRate * 0.003) * 2)
+        self._silencePrefix = array.array('h', bytes(int(sampleRate * 0.003) * 2))
+        # Per-sample gain curve for the fade, built once so applying it needs
+        # no per-sample Python code.
+        self._fadeGain = self._buildFadeGain(self._fadeInSamples)
 
         self.start()
-        self._init.wait()
+        if waitForInit:
+            self._init.wait()
+
+    def waitForInit(self, timeout: Optional[float] = None) -> bool:
+        """Block until the audio thread has tried to create its WavePlayer."""
+        return self._init.wait(timeout)
 
     def _getOutputDevice(self):
-        """Get the configured audio output device."""
-        try:
-            return config.conf["audio"]["outputDevice"]
-        except Exception:
+        """Get the configured audio output device.
+
+        NVDA 2025.1 moved the setting from the "speech" to the "audio"
+        section. The section that holds it is found once and cached, since
+        this runs on every wake of the audio thread.
+        """
+        global _outputDeviceSection
+        if _outputDeviceSection is not None:
+            try:
+                return config.conf[_outputDeviceSection]["outputDevice"]
+            except Exception:
+                _outputDeviceSection = None
+        for section in ("audio", "speech"):
             try:
-                return config.conf["speech"]["outputDevice"]
+                device = config.conf[section]["outputDevice"]
             except Exception:
-                return None
+                continue
+            _outputDeviceSection = section
+            return device
+        return None
+
+    def _feed(self, data, onDone=None, size=None) -> None:
+        """Feed audio data to the wave player.
 
-    def _feed(self, data: bytes, onDone=None) -> None:
-        """Feed audio data to the wave player."""
+        ``data`` is either bytes, or a ctypes pointer with ``size`` in bytes;
+        WavePlayer.feed accepts both on every NVDA version we support.
+        """
         if not self._wavePlayer:
             return
         try:
-            self._wavePlayer.feed(data, onDone=onDone)
+            self._wavePlayer.feed(data, size=size, onDone=onDone)
         except Exception:
             if not self._feedErrorLogged:
                 log.error("nvSpeechPlayer: WavePlayer.feed failed", exc_info=True)
                 self._feedErrorLogged = True
 
-    def _applyFadeInEnvelope(self, audioBytes: bytes) -> bytes:
-        """Apply fade-in envelope to audio samples. Returns modified bytes.
+    @classmethod
+    def _buildFadeGain(cls, fadeLen: int) -> tuple:
+        """Return the per-sample fade-in gains (Q15 integers) for a fade.
+
+        The first few samples are zero (to mask any click from stop()); the
+        rest follow a 256-step cosine curve, stretched over the remaining
+        samples.
+        """
+        if fadeLen <= 0:
+            return ()
+        zeroSamples = min(fadeLen // 4, 30)  # ~0.7ms at 44.1kHz
+        steps = cls._FADE_TABLE_SIZE - 1
+        fadeRemaining = fadeLen - zeroSamples
+        gains = [0] * zeroSamples
+        for i in range(fadeRemaining):
+            # Map sample index to curve step (starting from where zeros end)
+            step = int((i / fadeRemaining) * steps)
+            gains.append(int((1.0 - math.cos(step * math.pi / steps)) / 2.0 * 32767))
+        return tuple(gains)
+
+    def _applyFadeInEnvelope(self, data, nbytes: int) -> bytes:
+        """Apply fade-in envelope to a synthesized chunk. Returns new bytes.
         
         Uses a modified cosine curve that starts at zero and ramps up.
         The first few samples are forced to zero to mask any click from stop().
+        The silence prefix is built into the same array as the samples, so
+        the result is produced with a single tobytes() and no concatenation.
         """
-        samples = array.array('h')
-        samples.frombytes(audioBytes)
-        fadeLen = min(self._fadeInSamples, len(samples))
+        # Start from the silence prefix, then copy the samples straight out
+        # of the ctypes buffer (via a char view; array rejects the '<h' format).
+        samples = array.array('h', self._silencePrefix)
+        offset = len(samples)
+        samples.frombytes((ctypes.c_char * nbytes).from_buffer(data))
+        fadeLen = min(self._fadeInSamples, len(samples) - offset)
         
         if fadeLen > 0:
-            # Force first few samples to absolute zero (mask any click)
-            zeroSamples = min(fadeLen // 4, 30)  # ~0.7ms at 44.1kHz
-            for i in range(zeroSamples):
-                samples[i] = 0
-            
-            # Apply cosine fade to remaining samples
-            tableSize = self._FADE_TABLE_SIZE
-            fadeTable = self._fadeTable
-            fadeStart = zeroSamples
-            fadeRemaining = fadeLen - fadeStart
-            
-            for i in range(fadeStart, fadeLen):
-                # Map sample index to table index (starting from where zeros end)
-                progress = (i - fadeStart) / fadeRemaining if fadeRemaining > 0 else 1.0
-                tableIdx = int(progress * (tableSize - 1))
-                samples[i] = int(samples[i] * fadeTable[tableIdx])
+            gains = self._fadeGain
+            if fadeLen < len(gains):
+                # Short chunk: squeeze the whole fade into it, as before.
+                gains = self._buildFadeGain(fadeLen)
+            # Integer multiply + shift via map() keeps the loop in C and never
+            # leaves the int16 range (|s * g| >> 15 <= |s|).
+            fadeEnd = offset + fadeLen
+            samples[offset:fadeEnd] = array.array(
+                'h',
+                map(operator.rshift,
+                    map(operator.mul, samples[offset:fadeEnd], gains),
+                    itertools.repeat(15)),
+            )
         
-        # Prepend silence to let audio device stabilize
-        return self._silencePrefix + samples.tobytes()
+        return samples.tobytes()
 
     def terminate(self):
         """Stop the audio thread and clean up resources."""
@@ -231,8 +316,26 @@ class AudioThread(threading.Thread):
         finally:
             self._init.set()
 
+        # Let MMCSS schedule the device feed as pro audio so chunks keep
+        # arriving on time under load (reverted when the thread exits).
+        mmcssHandle = joinMmcssTask("Pro Audio")
+        try:
+            self._runLoop()
+        finally:
+            leaveMmcssTask(mmcssHandle)
+
+    def _runLoop(self):
+        """Synthesize and feed audio until terminate()."""
         # Local references for faster access in tight loop
         player = self._player
+        synthesize = player.synthesize
+        getLastIndex = player.getLastIndex
+        feed = self._feed
+        addressof = ctypes.addressof
+        c_void_p = ctypes.c_void_p
+        chunkBufs = self._chunkBufs
+        chunkSamples = self._CHUNK_SAMPLES
+        bufIdx = 0
         wavePlayer = self._wavePlayer
         wake = self._wake
         synthRef = self._synthRef
@@ -270,11 +373,14 @@ class AudioThread(threading.Thread):
             lastIndex = None
             isFirstChunk = True
             didSpeak = False
+            # Resolve the driver once per stream rather than per chunk. It is
+            # released again below so we don't keep it alive while idle.
+            synth = synthRef()
 
             while self._keepAlive and self.isSpeaking:
                 didSpeak = True
                 try:
-                    data = player.synthesize(8192)
+                    data = synthesize(chunkSamples, chunkBufs[bufIdx])
                 except Exception:
                     if not self._synthErrorLogged:
                         log.error("nvSpeechPlayer: speechPlayer.synthesize failed", exc_info=True)
@@ -291,42 +397,41 @@ class AudioThread(threading.Thread):
                     break
 
                 if data:
-                    n = int(getattr(data, "length", 0) or 0)
-                    if n <= 0:
-                        continue
+                    # SpeechPlayer.synthesize() only returns a buffer when it
+                    # produced samples, with .length set to the sample count.
+                    n = data.length
+                    bufIdx ^= 1
 
                     nbytes = n * 2  # 16-bit = 2 bytes per sample
-                    audioBytes = ctypes.string_at(ctypes.addressof(data), nbytes)
 
                     # Apply fade-in to first chunk after stop()/idle() to prevent click
                     if self._applyFadeIn and isFirstChunk:
-                        audioBytes = self._applyFadeInEnvelope(audioBytes)
+                        audioBytes = self._applyFadeInEnvelope(data, nbytes)
+                        audioSize = None
                         self._applyFadeIn = False
+                    else:
+                        # Hand the DLL buffer straight to the player instead of
+                        # copying it into a bytes object first. ``data`` is one
+                        # of our _chunkBufs, so it outlives the chunk's playback.
+                        audioBytes = c_void_p(addressof(data))
+                        audioSize = nbytes
                     isFirstChunk = False
 
-                    idx = int(player.getLastIndex())
-                    s = synthRef()
+                    idx = getLastIndex()
 
                     if idx >= 0:
-                        def cb(index=idx, synth=s):
-                            if synth:
-                                synthIndexReached.notify(synth=synth, index=index)
-                        self._feed(audioBytes, onDone=cb)
+                        feed(audioBytes, onDone=partial(_notifyIndex, synth, idx), size=audioSize)
                     else:
-                        self._feed(audioBytes)
+                        feed(audioBytes, size=audioSize)
 
                     lastIndex = idx
                     continue
 
                 # No audio was produced - check for index markers
-                idx = int(player.getLastIndex())
+                idx = getLastIndex()
                 if idx >= 0 and idx != lastIndex:
-                    s = synthRef()
-                    if s:
-                        def cb(index=idx, synth=s):
-                            if synth:
-                                synthIndexReached.notify(synth=synth, index=index)
-                        self._feed(b"", onDone=cb)
+                    if synth:
+                        feed(b"", onDone=partial(_notifyIndex, synth, idx))
                     lastIndex = idx
                     continue
 
@@ -358,8 +463,8 @@ class AudioThread(threading.Thread):
                         log.debug("nvSpeechPlayer: WavePlayer.idle failed", exc_info=True)
                         self._idleErrorLogged = True
 
-                s = synthRef()
-                if s:
-                    synthDoneSpeaking.notify(synth=s)
+                if synth:
+                    synthDoneSpeaking.notify(synth=synth)
 
+            synth = None
             self.isSpeaking = False
@@ -9,7 +9,6 @@ This module contains:
 - Voice profile prefix
 """
 
-from collections import OrderedDict
 from synthDriverHandler import VoiceInfo
 
 
@@ -21,52 +20,48 @@ except Exception:
 
 
 # Language choices exposed in NVDA settings.
-languages = OrderedDict([
-    ("auto", VoiceInfo("auto", _("Auto (match NVDA language)"))),
-    ("en-us", VoiceInfo("en-us", "English (US)")),
-    ("en-gb", VoiceInfo("en-gb", "English (UK)")),
-    ("zh", VoiceInfo("zh", "Chinese")),
-    ("pt", VoiceInfo("pt", "Portuguese")),
-    ("hu", VoiceInfo("hu", "Hungarian")),
-    ("fi", VoiceInfo("fi", "Finnish")),
-    ("bg", VoiceInfo("bg", "Bulgarian")),
-    ("fr", VoiceInfo("fr", "French")),
-    ("es", VoiceInfo("es", "Spanish (Spain)")),
-    ("es-mx", VoiceInfo("es-mx", "Spanish (México)")),
-    ("it", VoiceInfo("it", "Italian")),
-    ("pt-br", VoiceInfo("pt-br", "Brazilian Portuguese")),
-    ("ro", VoiceInfo("ro", "Romanian")),
-    ("de", VoiceInfo("de", "German")),
-    ("nl", VoiceInfo("nl", "Dutch")),
-    ("da", VoiceInfo("da", "Danish")),
-    ("sv", VoiceInfo("sv", "Swedish")),
-    ("cs", VoiceInfo("cs", "Czech")),
-    ("hr", VoiceInfo("hr", "Croatian")),
-    ("pl", VoiceInfo("pl", "Polish")),
-    ("ru", VoiceInfo("ru", "Russian")),
-    ("sk", VoiceInfo("sk", "Slovak")),
-    ("uk", VoiceInfo("uk", "Ukrainian")),
-])
+languages = {
+    "auto": VoiceInfo("auto", _("Auto (match NVDA language)")),
+    "en-us": VoiceInfo("en-us", "English (US)"),
+    "en-gb": VoiceInfo("en-gb", "English (UK)"),
+    "zh": VoiceInfo("zh", "Chinese"),
+    "pt": VoiceInfo("pt", "Portuguese"),
+    "hu": VoiceInfo("hu", "Hungarian"),
+    "fi": VoiceInfo("fi", "Finnish"),
+    "bg": VoiceInfo("bg", "Bulgarian"),
+    "fr": VoiceInfo("fr", "French"),
+    "es": VoiceInfo("es", "Spanish (Spain)"),
+    "es-mx": VoiceInfo("es-mx", "Spanish (México)"),
+    "it": VoiceInfo("it", "Italian"),
+    "pt-br": VoiceInfo("pt-br", "Brazilian Portuguese"),
+    "ro": VoiceInfo("ro", "Romanian"),
+    "de": VoiceInfo("de", "German"),
+    "nl": VoiceInfo("nl", "Dutch"),
+    "da": VoiceInfo("da", "Danish"),
+    "sv": VoiceInfo("sv", "Swedish"),
+    "cs": VoiceInfo("cs", "Czech"),
+    "hr": VoiceInfo("hr", "Croatian"),
+    "pl": VoiceInfo("pl", "Polish"),
+    "ru": VoiceInfo("ru", "Russian"),
+    "sk": VoiceInfo("sk", "Slovak"),
+    "uk": VoiceInfo("uk", "Ukrainian"),
+}
 
 
 # Punctuation pause modes exposed in NVDA settings.
-pauseModes = OrderedDict(
-    (
-        ("off", VoiceInfo("off", _("Off"))),
-        ("short", VoiceInfo("short", _("Short"))),
-        ("long", VoiceInfo("long", _("Long"))),
-    )
-)
+pauseModes = {
+    "off": VoiceInfo("off", _("Off")),
+    "short": VoiceInfo("short", _("Short")),
+    "long": VoiceInfo("long", _("Long")),
+}
 
 # Sample rates exposed in NVDA settings
-sampleRates = OrderedDict(
-    (
-        ("11025", VoiceInfo("11025", _("11025 Hz"))),
-        ("16000", VoiceInfo("16000", _("16000 Hz (default)"))),
-        ("22050", VoiceInfo("22050", _("22050 Hz"))),
-        ("44100", VoiceInfo("44100", _("44100 Hz"))),
-    )
-)
+sampleRates = {
+    "11025": VoiceInfo("11025", _("11025 Hz")),
+    "16000": VoiceInfo("16000", _("16000 Hz (default)")),
+    "22050": VoiceInfo("22050", _("22050 Hz")),
+    "44100": VoiceInfo("44100", _("44100 Hz")),
+}
 
 
 # Voice presets: multipliers/overrides on generated frames
@@ -206,12 +206,12 @@ def parseSettingsSectionFromText(text: str) -> SettingsSection:
 
 
 def parseSettingsSectionFromFile(path: str) -> SettingsSection:
-    if not os.path.isfile(path):
-        return SettingsSection(settings={}, startLine=None, endLine=None, keyLineIndex=None)
+    # Just try to open it: most chain layers (e.g. "en-us") may not exist, and
+    # a separate isfile() check costs an extra stat for the ones that do.
     try:
         return parseSettingsSectionFromText(_readFileText(path))
     except Exception:
-        # Corrupt/unsupported YAML; treat as empty.
+        # Missing, unreadable or corrupt/unsupported YAML; treat as empty.
         return SettingsSection(settings={}, startLine=None, endLine=None, keyLineIndex=None)
 
 
@@ -3,7 +3,8 @@
 
 This module contains:
 - Voice profile discovery from phonemes.yaml (fallback if frontend doesn't support it)
-- Voice-to-frame application for Python preset voices (Adam, Benjamin, etc.)
+- Voice-to-frame operations for Python preset voices (Adam, Benjamin, etc.),
+  compiled into per-frame apply functions by compileFrameOps()
 
 Note: Voicing tone parsing is now handled by the C++ frontend (ABI v2+).
 """
@@ -89,7 +90,7 @@ def discoverVoiceProfiles(packsDir: str) -> list:
     return profiles
 
 
-def buildVoiceOps(voices: dict, frameFieldNames: set) -> dict:
+def buildVoiceOps(voices: dict, frameFieldNames: frozenset) -> dict:
     """Pre-calculate per-voice operations for fast application.
     
     This is used for Python preset voices (Adam, Benjamin, Robert, etc.)
@@ -97,46 +98,61 @@ def buildVoiceOps(voices: dict, frameFieldNames: set) -> dict:
     
     Args:
         voices: Dict of voice name -> voice parameters
-        frameFieldNames: Set of valid frame field names
+        frameFieldNames: Frozenset of valid frame field names
         
     Returns:
         Dict of voice name -> (absOps tuple, mulOps tuple)
         where absOps are (paramName, value) for absolute overrides
         and mulOps are (paramName, multiplier) for multiplied values
     """
-    voiceOps = {}
-    for voiceName, voiceMap in voices.items():
-        absOps = []
-        mulOps = []
-        for k, v in (voiceMap or {}).items():
-            if not isinstance(k, str):
-                continue
-            if k.endswith("_mul"):
-                param = k[:-4]
-                if param in frameFieldNames:
-                    mulOps.append((param, v))
-            else:
-                if k in frameFieldNames:
-                    absOps.append((k, v))
-        voiceOps[voiceName] = (tuple(absOps), tuple(mulOps))
-    return voiceOps
+    return {
+        voiceName: (
+            tuple(
+                (k, v) for k, v in (voiceMap or {}).items()
+                if isinstance(k, str) and not k.endswith("_mul") and k in frameFieldNames
+            ),
+            tuple(
+                (k[:-4], v) for k, v in (voiceMap or {}).items()
+                if isinstance(k, str) and k.endswith("_mul") and k[:-4] in frameFieldNames
+            ),
+        )
+        for voiceName, voiceMap in voices.items()
+    }
 
 
-def applyVoiceToFrame(frame, voiceName: str, voiceOps: dict) -> None:
-    """Apply voice preset parameters to a frame.
-    
-    This applies per-frame multipliers and overrides for Python preset voices.
-    YAML voice profiles are handled differently (formant transforms in frontend).
-    
+def compileFrameOps(absOps: tuple, mulOps: tuple):
+    """Compile frame operations into a specialized apply function.
+
+    The per-frame path is hot, so instead of looping over op tuples with
+    setattr/getattr, the assignments are unrolled into generated code, e.g.:
+
+        def apply(frame):
+            frame.cf4 = _c0
+            frame.cb1 *= _c1
+            frame.preFormantGain *= _c2
+
+    Absolute overrides run first, then multipliers in the given order.
+    Field names must already be checked against Frame._fields_ (so they are
+    valid identifiers).
+
     Args:
-        frame: The SpeechPlayer frame to modify (speechPlayer.Frame)
-        voiceName: Name of the voice preset
-        voiceOps: Pre-calculated voice operations dict
-    """
-    absOps, mulOps = voiceOps.get(voiceName) or voiceOps.get("Adam", ((), ()))
+        absOps: Tuple of (paramName, value) absolute overrides
+        mulOps: Tuple of (paramName, multiplier) scalings
 
+    Returns:
+        callable(frame)
+    """
+    ns = {}
+    lines = ["def apply(frame):"]
     for paramName, absVal in absOps:
-        setattr(frame, paramName, absVal)
-
+        const = "_c%d" % len(ns)
+        ns[const] = absVal
+        lines.append("    frame.%s = %s" % (paramName, const))
     for paramName, mulVal in mulOps:
-        setattr(frame, paramName, getattr(frame, paramName) * mulVal)
\ No newline at end of file
+        const = "_c%d" % len(ns)
+        ns[const] = mulVal
+        lines.append("    frame.%s *= %s" % (paramName, const))
+    if len(lines) == 1:
+        lines.append("    pass")
+    exec("\n".join(lines), ns)
+    return ns["apply"]
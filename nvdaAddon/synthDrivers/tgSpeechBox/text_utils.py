@@ -13,13 +13,19 @@ import re
 
 # Split on punctuation+space for clause pauses
 re_textPause = re.compile(r"(?<=[.?!,:;])\s", re.DOTALL | re.UNICODE)
+# The characters re_textPause looks behind for.
+_PAUSE_PUNCT = ".?!,:;"
 
-# Normalize whitespace before feeding eSpeak
-_re_lineBreaks = re.compile(r"[\r\n\u2028\u2029]+", re.UNICODE)
-_re_spaceRuns = re.compile(r"[\t \u00A0]+", re.UNICODE)
+# Normalize whitespace before feeding eSpeak: line breaks and runs of
+# spaces/tabs/NBSP all collapse to a single space in one pass.
+_re_ws = re.compile(r"[\r\n\u2028\u2029\t \u00A0]+", re.UNICODE)
+# Any whitespace _re_ws would change other than a lone plain space
+_re_wsSpecial = re.compile(r"[\r\n\u2028\u2029\t\u00A0]", re.UNICODE)
 
-# Sentence end detection for Say All coalescing
-_SENT_END_RE = re.compile(r"(?:[.!?]+|\.{3})[)\]\"']*\s*$")
+# Sentence end detection for Say All coalescing: terminal punctuation,
+# optionally followed by closing brackets/quotes.
+_SENT_END_CHARS = frozenset(".!?")
+_SENT_END_CLOSERS = frozenset(")]\"'")
 
 
 def normalizeTextForEspeak(text: str) -> str:
@@ -31,11 +37,34 @@ def normalizeTextForEspeak(text: str) -> str:
     """
     if not text:
         return ""
-    # Convert newlines to spaces so line wrapping doesn't introduce pauses.
-    text = _re_lineBreaks.sub(" ", text)
-    # Collapse other common whitespace runs.
-    text = _re_spaceRuns.sub(" ", text)
-    return text.strip()
+    # Most text (short announcements especially) has nothing to collapse;
+    # searching is much cheaper than substituting.
+    if "  " not in text and not _re_wsSpecial.search(text):
+        return text.strip()
+    # Newlines become spaces so line wrapping doesn't introduce pauses.
+    return _re_ws.sub(" ", text).strip()
+
+
+def iterClauses(text: str):
+    """Yield the clauses of text, split after punctuation+space.
+
+    Equivalent to ``re_textPause.split(text)`` but lazy, so long Say All
+    text isn't copied into a list of substrings up front.
+    """
+    # Most short announcements have no pause punctuation at all; a few
+    # substring checks are much cheaper than running the lookbehind regex.
+    for c in _PAUSE_PUNCT:
+        if c in text:
+            break
+    else:
+        yield text
+        return
+
+    last = 0
+    for m in re_textPause.finditer(text):
+        yield text[last:m.start()]
+        last = m.end()
+    yield text[last:]
 
 
 def looksLikeSentenceEnd(s: str) -> bool:
@@ -45,7 +74,13 @@ def looksLikeSentenceEnd(s: str) -> bool:
     """
     if not s:
         return False
-    return bool(_SENT_END_RE.search(s.strip()))
+    # Tail scan rather than a regex search: this runs once per Say All chunk
+    # and only ever needs to look at the last few characters.
+    s = s.rstrip()
+    i = len(s) - 1
+    while i >= 0 and s[i] in _SENT_END_CLOSERS:
+        i -= 1
+    return i >= 0 and s[i] in _SENT_END_CHARS
 
 
 # ── Script-aware text splitting ─────────────────────────────────────────
@@ -300,6 +300,9 @@ class SpeechPlayer(object):
             raise RuntimeError("speechPlayer_initialize failed")
 
     def _setupPrototypes(self) -> None:
+        # Every entry point gets argtypes/restype, so callers pass plain Python
+        # ints: ctypes converts them directly, and wrapping them in c_int()/
+        # c_uint() first would only allocate an extra object per call.
         # void* speechPlayer_initialize(int sampleRate);
         self._dll.speechPlayer_initialize.argtypes = (c_int,)
         self._dll.speechPlayer_initialize.restype = c_void_p
@@ -390,10 +393,10 @@ class SpeechPlayer(object):
         self._dll.speechPlayer_queueFrame(
             self._speechHandle,
             framePtr,
-            c_uint(minSamples),
-            c_uint(fadeSamples),
-            c_int(int(userIndex) if userIndex is not None else -1),
-            c_int(1 if purgeQueue else 0),
+            minSamples,
+            fadeSamples,
+            int(userIndex) if userIndex is not None else -1,
+            1 if purgeQueue else 0,
         )
 
     def queueFrameEx(self, frame, frameEx, minFrameDuration, fadeDuration,
@@ -434,11 +437,11 @@ class SpeechPlayer(object):
                 self._speechHandle,
                 framePtr,
                 frameExPtr,
-                c_uint(frameExSize),
-                c_uint(minSamples),
-                c_uint(fadeSamples),
-                c_int(int(userIndex) if userIndex is not None else -1),
-                c_int(1 if purgeQueue else 0),
+                frameExSize,
+                minSamples,
+                fadeSamples,
+                int(userIndex) if userIndex is not None else -1,
+                1 if purgeQueue else 0,
             )
             return True
         
@@ -446,10 +449,10 @@ class SpeechPlayer(object):
         self._dll.speechPlayer_queueFrame(
             self._speechHandle,
             framePtr,
-            c_uint(minSamples),
-            c_uint(fadeSamples),
-            c_int(int(userIndex) if userIndex is not None else -1),
-            c_int(1 if purgeQueue else 0),
+            minSamples,
+            fadeSamples,
+            int(userIndex) if userIndex is not None else -1,
+            1 if purgeQueue else 0,
         )
         return False
 
@@ -457,12 +460,20 @@ class SpeechPlayer(object):
         """Check if the DLL supports extended frame parameters (DSP v5+)."""
         return getattr(self, "_hasQueueFrameExApi", False)
 
-    def synthesize(self, numSamples: int):
+    def synthesize(self, numSamples: int, out=None):
+        """Synthesize up to numSamples samples.
+
+        If out (a c_short array) is given, samples are written into it instead
+        of a newly allocated buffer, so callers can reuse their own buffers.
+        Returns the buffer with .length set to the sample count, or None.
+        """
         n = int(numSamples)
+        if out is not None:
+            n = min(n, len(out))
         if n <= 0:
             return None
-        buf = (c_short * n)()
-        res = self._dll.speechPlayer_synthesize(self._speechHandle, c_uint(n), buf)
+        buf = out if out is not None else (c_short * n)()
+        res = self._dll.speechPlayer_synthesize(self._speechHandle, n, buf)
         if res > 0:
             buf.length = min(int(res), n)
             return buf
@@ -8,6 +8,7 @@ Licensed under the MIT License. See LICENSE for details.
 
 #include <cmath>
 #include <cstdio>
+#include <cstring>
 #include <fstream>
 #include <mutex>
 #include <new>
@@ -51,8 +52,33 @@ struct Handle {
   
   // Buffer for getVoiceProfileNames return value
   std::string profileNamesBuffer;
+
+  // Records returned by nvspFrontend_queueIPA_Batch (ABI v5+).
+  // Reused across calls so steady-state batching doesn't allocate.
+  std::vector<nvspFrontend_FrameRecord> batchRecords;
+
+  // packSetSignature() of the active pack taken just before it was loaded,
+  // and the voice profile name it was loaded with (setVoiceProfile edits
+  // pack.lang.voiceProfileName in place). Empty signature = don't cache.
+  std::string packSignature;
+  std::string packLoadedVoiceProfile;
+
+  // Previously loaded packs kept for fast language switching (ABI v6+),
+  // most recently used first. An entry is only reused while its signature
+  // still matches the files on disk.
+  struct CachedPack {
+    std::string langTag;
+    std::string signature;
+    std::string loadedVoiceProfile;
+    PackSet pack;
+  };
+  std::vector<CachedPack> packCache;
 };
 
+// Upper bound on Handle::packCache entries (the en-us entry alone carries
+// the stress dictionary, so keep this small).
+static const size_t kMaxCachedPacks = 8;
+
 static Handle* asHandle(nvspFrontend_handle_t h) {
   return reinterpret_cast<Handle*>(h);
 }
@@ -81,6 +107,79 @@ static std::string formatDouble(double val, int precision = 2) {
   return s;
 }
 
+// ---- Pack cache (ABI v6+) -------------------------------------------------
+// Call with h->mu held.
+
+static void putCachedPack(Handle* h, Handle::CachedPack&& entry) {
+  auto& cache = h->packCache;
+  for (auto it = cache.begin(); it != cache.end(); ++it) {
+    if (it->langTag == entry.langTag) {
+      cache.erase(it);
+      break;
+    }
+  }
+  cache.insert(cache.begin(), std::move(entry));
+  if (cache.size() > kMaxCachedPacks) cache.pop_back();
+}
+
+// Make `pack` the active pack. The previous one goes to the cache unless it
+// is a stale copy of the same language.
+static void activatePack(
+  Handle* h,
+  PackSet&& pack,
+  const std::string& langTag,
+  const std::string& signature,
+  const std::string& loadedVoiceProfile
+) {
+  if (h->packLoaded && !h->packSignature.empty() && h->langTag != langTag) {
+    Handle::CachedPack prev;
+    prev.langTag = h->langTag;
+    prev.signature = h->packSignature;
+    prev.loadedVoiceProfile = h->packLoadedVoiceProfile;
+    prev.pack = std::move(h->pack);
+    putCachedPack(h, std::move(prev));
+  }
+
+  h->pack = std::move(pack);
+  h->pack.lang.voiceProfileName = loadedVoiceProfile;
+  h->packLoaded = true;
+  h->packSignature = signature;
+  h->packLoadedVoiceProfile = loadedVoiceProfile;
+  h->langTag = langTag;
+  // Treat language change as the start of a new stream, so we don't
+  // insert a segment boundary gap before the first chunk in the new language.
+  h->streamHasSpeech = false;
+  h->lastEndsVowelLike = false;
+}
+
+// Parse and activate the packs for `lang`. Returns 0 (with lastError set) on
+// failure, leaving the current pack active.
+static int loadAndActivatePack(Handle* h, const std::string& lang) {
+  // Taken before parsing, so an edit made while we parse shows up as a
+  // mismatch (and a reload) next time rather than being missed.
+  const std::string signature = packSetSignature(h->packDir, lang);
+
+  PackSet pack;
+  std::string err;
+  if (!loadPackSet(h->packDir, lang, pack, err)) {
+    setError(h, err.empty() ? "Failed to load pack set" : err);
+    return 0;
+  }
+
+  const std::string loadedVoiceProfile = pack.lang.voiceProfileName;
+  const std::string langTag = normalizeLangTag(lang);
+  // A fresh parse supersedes any cached copy of this language.
+  auto& cache = h->packCache;
+  for (auto it = cache.begin(); it != cache.end(); ++it) {
+    if (it->langTag == langTag) {
+      cache.erase(it);
+      break;
+    }
+  }
+  activatePack(h, std::move(pack), langTag, signature, loadedVoiceProfile);
+  return 1;
+}
+
 } // namespace nvsp_frontend
 
 extern "C" {
@@ -113,20 +212,89 @@ NVSP_FRONTEND_API int nvspFrontend_setLanguage(nvspFrontend_handle_t handle, con
   h->lastError.clear();
   const std::string lang = langTagUtf8 ? std::string(langTagUtf8) : std::string();
 
+  // Always re-parse: callers use this to pick up edited YAML.
+  return loadAndActivatePack(h, lang);
+}
+
+NVSP_FRONTEND_API int nvspFrontend_activateLanguage(nvspFrontend_handle_t handle, const char* langTagUtf8) {
+  using namespace nvsp_frontend;
+  Handle* h = asHandle(handle);
+  if (!h) return 0;
+
+  std::lock_guard<std::mutex> lock(h->mu);
+
+  h->lastError.clear();
+  const std::string lang = langTagUtf8 ? std::string(langTagUtf8) : std::string();
+  const std::string langTag = normalizeLangTag(lang);
+  const std::string signature = packSetSignature(h->packDir, lang);
+
+  if (!signature.empty()) {
+    // Already active and unchanged on disk: behave like a reload without parsing.
+    if (h->packLoaded && h->langTag == langTag && h->packSignature == signature) {
+      h->pack.lang.voiceProfileName = h->packLoadedVoiceProfile;
+      h->streamHasSpeech = false;
+      h->lastEndsVowelLike = false;
+      return 1;
+    }
+
+    auto& cache = h->packCache;
+    for (auto it = cache.begin(); it != cache.end(); ++it) {
+      if (it->langTag != langTag) continue;
+      if (it->signature != signature) {
+        cache.erase(it);  // stale
+        break;
+      }
+      Handle::CachedPack entry = std::move(*it);
+      cache.erase(it);
+      activatePack(h, std::move(entry.pack), langTag, signature, entry.loadedVoiceProfile);
+      return 1;
+    }
+  }
+
+  return loadAndActivatePack(h, lang);
+}
+
+NVSP_FRONTEND_API int nvspFrontend_preloadLanguage(nvspFrontend_handle_t handle, const char* langTagUtf8) {
+  using namespace nvsp_frontend;
+  Handle* h = asHandle(handle);
+  if (!h) return 0;
+
+  // packDir never changes after create, so the signature and the parse
+  // don't need the lock; speech on this handle keeps running meanwhile.
+  const std::string lang = langTagUtf8 ? std::string(langTagUtf8) : std::string();
+  const std::string langTag = normalizeLangTag(lang);
+  const std::string signature = packSetSignature(h->packDir, lang);
+  if (signature.empty()) {
+    std::lock_guard<std::mutex> lock(h->mu);
+    setError(h, "Could not find phonemes.yaml under: " + h->packDir);
+    return 0;
+  }
+
+  {
+    std::lock_guard<std::mutex> lock(h->mu);
+    if (h->packLoaded && h->langTag == langTag && h->packSignature == signature) return 1;
+    for (const auto& entry : h->packCache) {
+      if (entry.langTag == langTag && entry.signature == signature) return 1;
+    }
+  }
+
   PackSet pack;
   std::string err;
   if (!loadPackSet(h->packDir, lang, pack, err)) {
+    std::lock_guard<std::mutex> lock(h->mu);
     setError(h, err.empty() ? "Failed to load pack set" : err);
     return 0;
   }
 
-  h->pack = std::move(pack);
-  h->packLoaded = true;
-  // Treat language change as the start of a new stream, so we don't
-  // insert a segment boundary gap before the first chunk in the new language.
-  h->streamHasSpeech = false;
-  h->lastEndsVowelLike = false;
-  h->langTag = normalizeLangTag(lang);
+  std::lock_guard<std::mutex> lock(h->mu);
+  // The language may have been activated while we were parsing.
+  if (h->packLoaded && h->langTag == langTag) return 1;
+  Handle::CachedPack entry;
+  entry.langTag = langTag;
+  entry.signature = signature;
+  entry.loadedVoiceProfile = pack.lang.voiceProfileName;
+  entry.pack = std::move(pack);
+  putCachedPack(h, std::move(entry));
   return 1;
 }
 
@@ -488,6 +656,61 @@ NVSP_FRONTEND_API int nvspFrontend_queueIPA_ExWithText(
                          clauseTypeUtf8, userIndexBase, cb, userData);
 }
 
+// FrameEx callback that appends each frame to a std::vector of records.
+static void collectFrameRecord(
+  void* userData,
+  const nvspFrontend_Frame* frameOrNull,
+  const nvspFrontend_FrameEx* frameExOrNull,
+  double durationMs,
+  double fadeMs,
+  int userIndex
+) {
+  auto* records = static_cast<std::vector<nvspFrontend_FrameRecord>*>(userData);
+  nvspFrontend_FrameRecord rec;
+  std::memset(&rec, 0, sizeof(rec));
+  if (frameOrNull) {
+    rec.frame = *frameOrNull;
+    rec.flags |= NVSP_FRONTEND_RECORD_HAS_FRAME;
+  }
+  if (frameExOrNull) {
+    rec.frameEx = *frameExOrNull;
+    rec.flags |= NVSP_FRONTEND_RECORD_HAS_FRAMEEX;
+  }
+  rec.durationMs = durationMs;
+  rec.fadeMs = fadeMs;
+  rec.userIndex = userIndex;
+  records->push_back(rec);
+}
+
+NVSP_FRONTEND_API int nvspFrontend_queueIPA_Batch(
+  nvspFrontend_handle_t handle,
+  const char* textUtf8,
+  const char* ipaUtf8,
+  double speed,
+  double basePitch,
+  double inflection,
+  const char* clauseTypeUtf8,
+  int userIndexBase,
+  const nvspFrontend_FrameRecord** outRecords,
+  int* outCount
+) {
+  using namespace nvsp_frontend;
+  if (outRecords) *outRecords = nullptr;
+  if (outCount) *outCount = 0;
+  Handle* h = asHandle(handle);
+  if (!h || !outRecords || !outCount) return 0;
+  std::lock_guard<std::mutex> lock(h->mu);
+
+  h->batchRecords.clear();
+  if (!queueIPA_ExImpl(h, textUtf8, ipaUtf8, speed, basePitch, inflection,
+                       clauseTypeUtf8, userIndexBase, collectFrameRecord, &h->batchRecords)) {
+    return 0;
+  }
+  *outRecords = h->batchRecords.data();
+  *outCount = static_cast<int>(h->batchRecords.size());
+  return 1;
+}
+
 NVSP_FRONTEND_API int nvspFrontend_getVoicingTone(
   nvspFrontend_handle_t handle,
   nvspFrontend_VoicingTone* outTone
@@ -869,6 +1092,9 @@ NVSP_FRONTEND_API int nvspFrontend_saveVoiceProfileSliders(
   }
   outFile.close();
 
+  // Every cached pack was parsed from the old phonemes.yaml.
+  h->packCache.clear();
+
   return 1;
 }
 
@@ -23,7 +23,7 @@ extern "C" {
   #define NVSP_FRONTEND_API
 #endif
 
-#define NVSP_FRONTEND_ABI_VERSION 4
+#define NVSP_FRONTEND_ABI_VERSION 6
 
 typedef void* nvspFrontend_handle_t;
 
@@ -225,6 +225,31 @@ NVSP_FRONTEND_API void nvspFrontend_destroy(nvspFrontend_handle_t handle);
 */
 NVSP_FRONTEND_API int nvspFrontend_setLanguage(nvspFrontend_handle_t handle, const char* langTagUtf8);
 
+/*
+  Switch language, reusing already parsed packs when possible (ABI v6+).
+
+  Like nvspFrontend_setLanguage, but if the packs for langTag were parsed
+  before on this handle (active earlier, or via nvspFrontend_preloadLanguage)
+  and none of their files changed on disk since (size/mtime), they are
+  reused instead of re-parsed. nvspFrontend_setLanguage always re-parses
+  and remains the way to force a reload after editing YAML.
+
+  Returns 1 on success, 0 on failure (the current language stays active).
+*/
+NVSP_FRONTEND_API int nvspFrontend_activateLanguage(nvspFrontend_handle_t handle, const char* langTagUtf8);
+
+/*
+  Parse the packs for langTag into the handle's cache without switching
+  to it (ABI v6+), so a later nvspFrontend_activateLanguage is instant.
+
+  The parse runs without holding the handle's lock, so it may be called
+  from a background thread while another thread is speaking. Only the
+  last few languages are kept.
+
+  Returns 1 on success (or if already cached), 0 on failure.
+*/
+NVSP_FRONTEND_API int nvspFrontend_preloadLanguage(nvspFrontend_handle_t handle, const char* langTagUtf8);
+
 /*
   Convert IPA text into frames.
 
@@ -395,6 +420,55 @@ NVSP_FRONTEND_API int nvspFrontend_queueIPA_ExWithText(
   void* userData
 );
 
+/*
+  One frame produced by nvspFrontend_queueIPA_Batch (ABI v5+).
+  - flags & NVSP_FRONTEND_RECORD_HAS_FRAME clear means "silence" for the
+    given duration (frame is zeroed and must be ignored).
+  - flags & NVSP_FRONTEND_RECORD_HAS_FRAMEEX clear means no extended
+    parameters (frameEx is zeroed and must be ignored).
+  - durationMs, fadeMs and userIndex are the same values the FrameEx
+    callback would have received.
+*/
+#define NVSP_FRONTEND_RECORD_HAS_FRAME   0x1
+#define NVSP_FRONTEND_RECORD_HAS_FRAMEEX 0x2
+
+typedef struct nvspFrontend_FrameRecord {
+  nvspFrontend_Frame frame;
+  nvspFrontend_FrameEx frameEx;
+  double durationMs;
+  double fadeMs;
+  int userIndex;
+  int flags;
+} nvspFrontend_FrameRecord;
+
+/*
+  Convert IPA text into frames and return them as one array (ABI v5+).
+
+  Same conversion as nvspFrontend_queueIPA_ExWithText (textUtf8 may be NULL
+  or ""), but instead of calling back once per frame the frames are
+  collected into a buffer owned by the handle. Callers that pay a high cost
+  per foreign-function callback (e.g. Python ctypes) can then walk the
+  records in one go.
+
+  On success, *outRecords points to *outCount records. The buffer stays
+  valid until the next nvspFrontend_queueIPA_Batch call on this handle or
+  nvspFrontend_destroy.
+
+  Returns 1 on success, 0 on failure (*outRecords = NULL, *outCount = 0).
+*/
+NVSP_FRONTEND_API int nvspFrontend_queueIPA_Batch(
+  nvspFrontend_handle_t handle,
+  const char* textUtf8,
+  const char* ipaUtf8,
+  double speed,
+  double basePitch,
+  double inflection,
+  const char* clauseTypeUtf8,
+  int userIndexBase,
+  const nvspFrontend_FrameRecord** outRecords,
+  int* outCount
+);
+
 /*
   Get the voicing tone parameters for the current voice profile (ABI v2+).
   
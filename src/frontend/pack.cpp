@@ -1856,6 +1856,41 @@ bool loadPackSet(
   return true;
 }
 
+std::string packSetSignature(const std::string& packDir, const std::string& langTag) {
+  std::string err;
+  const fs::path packsRoot = findPacksRoot(packDir, err);
+  if (packsRoot.empty()) return std::string();
+
+  // Same file list as loadPackSet().
+  const std::string tag = normalizeLangTag(langTag);
+  std::vector<fs::path> files;
+  files.push_back(packsRoot / "phonemes.yaml");
+  for (const auto& name : buildLangFileChain(tag)) {
+    files.push_back(packsRoot / "lang" / (name + ".yaml"));
+  }
+  files.push_back(packsRoot / "dict" / (tag + "-stress.tsv"));
+
+  std::string sig;
+  for (const auto& file : files) {
+    std::error_code ec;
+    const auto size = fs::file_size(file, ec);
+    if (ec) {
+      sig += "-;";
+      continue;
+    }
+    const auto mtime = fs::last_write_time(file, ec);
+    if (ec) {
+      sig += "-;";
+      continue;
+    }
+    sig += std::to_string(size);
+    sig += ':';
+    sig += std::to_string(mtime.time_since_epoch().count());
+    sig += ';';
+  }
+  return sig;
+}
+
 bool hasPhoneme(const PackSet& pack, const std::u32string& key) {
   return pack.phonemes.find(key) != pack.phonemes.end();
 }
@@ -1111,6 +1111,13 @@ bool loadPackSet(
   std::string& outError
 );
 
+// Cheap fingerprint of every file loadPackSet() reads for langTag
+// (phonemes.yaml, the lang/*.yaml inheritance chain and the stress dict):
+// size and modification time of each, with missing files marked.
+// Two equal signatures mean a reload would produce the same PackSet.
+// Returns "" if the packs directory can't be found.
+std::string packSetSignature(const std::string& packDir, const std::string& langTag);
+
 // Utility: does this pack contain a phoneme key?
 bool hasPhoneme(const PackSet& pack, const std::u32string& key);
 